@@ -1,9 +1,30 @@
+import json
+import os
+from functools import lru_cache
+
 import dash
 from dash import dcc, html
+from plotly.io.json import to_json_plotly
 from dash.dependencies import Input, Output, State
 import dash_bootstrap_components as dbc
+import metrics
+import profiling
 from tabs import content, creator_talent, exec_overview, genre_intelligence, geo_insights, strat_recom, trend
 
+PAGES = {
+    '1': exec_overview,
+    '2': content,
+    '3': trend,
+    '4': geo_insights,
+    '5': genre_intelligence,
+    '6': creator_talent,
+    '7': strat_recom,
+}
+
+# Keep-alive tabs: with KEEP_ALIVE_TABS=n the n most recently visited tabs stay mounted (hidden while
+# inactive), so going back to one neither rebuilds it nor re-runs its callbacks. 0 (default) is off.
+KEEP_ALIVE_TABS = max(int(os.environ.get('KEEP_ALIVE_TABS', 0)), 0)
+
 app = dash.Dash(__name__, 
                 external_stylesheets=['/assets/style.css'],
                 title='Team 13',
@@ -78,6 +99,7 @@ app.layout = dbc.Container([
         # --- PAGE CONTENT (shifted right of sidebar) ---
         html.Div(
             id='page-content',
+            children=[html.Div(id=f'tab-pane-{tab_id}') for tab_id in PAGES] if KEEP_ALIVE_TABS else None,
             style={
                 'marginLeft': '100px',       # creates space for fixed sidebar
                 'padding': '20px',
@@ -92,93 +114,96 @@ app.layout = dbc.Container([
 )
 ,
     dcc.Store(id='current-theme', data='dark'),
+    dcc.Store(id='mounted-tabs', data=[]),
 ], fluid=True, className="dashboard-container")
 
 
-# hover over nav items
+# hover over nav items (runs in the browser: it only swaps class names)
 tab_icon_outputs = [Output(f'tab-icon-{i}', 'className') for i in range(1, 8)]
 tab_icon_inputs = [Input(f'tab-icon-{i}', 'n_clicks') for i in range(1, 8)]
 
-@app.callback(
+app.clientside_callback(
+    """
+    function() {
+        const triggered = dash_clientside.callback_context.triggered_id || 'tab-icon-1';
+        return Array.from({length: 7}, (_, i) =>
+            `tab-icon-${i + 1}` === triggered ? 'tab-icon active' : 'tab-icon');
+    }
+    """,
     tab_icon_outputs,
     tab_icon_inputs,
 )
-def update_active_tab_style(*args):
-    
-    ctx = dash.callback_context
-    triggered_id = ctx.triggered_id
-    
-    base_class = 'tab-icon'
-    new_class_names = []
-    
-    for i in range(1, 8):
-        icon_id = f'tab-icon-{i}'
-        
-        if not triggered_id and i == 1:
-            new_class_names.append(f'{base_class} active')
-        elif triggered_id == icon_id:
-            new_class_names.append(f'{base_class} active')
-        else:
-            new_class_names.append(base_class)
-            
-    return new_class_names
 
 
 # nav router
-@app.callback(
-    Output('page-content', 'children'),
-    [Input('tab-icon-1', 'n_clicks'),
-     Input('tab-icon-2', 'n_clicks'),
-     Input('tab-icon-3', 'n_clicks'),
-     Input('tab-icon-4', 'n_clicks'),
-     Input('tab-icon-5', 'n_clicks'),
-     Input('tab-icon-6', 'n_clicks'),
-     Input('tab-icon-7', 'n_clicks')]
-)
-def render_page_content(*args):
-    ctx = dash.callback_context
-
-    if not ctx.triggered_id:
-        tab_id = '1'
-    else:
-        tab_id = ctx.triggered_id.replace('tab-icon-', '')
-
-    if tab_id == '1':
-        return exec_overview.layout
-    elif tab_id == '2':
-        return content.layout
-    elif tab_id == '3':
-        return trend.layout
-    elif tab_id == '4':
-        return geo_insights.layout
-    elif tab_id == '5':
-        return genre_intelligence.layout
-    elif tab_id == '6':
-        return creator_talent.layout
-    elif tab_id == '7':
-        return strat_recom.layout
-    return html.H2("Error, Please reload.")
-
-
-# theme switcher
-@app.callback(
+@lru_cache(maxsize=None)
+def page_layout(tab_id):
+    """A tab's layout converted once per process from components to plain JSON data (dicts and lists).
+
+    The component trees never change after import, so walking them on every tab switch is wasted work.
+    Dash still encodes the response each time, but plain dicts go through the encoder in one pass.
+    """
+    page = PAGES.get(tab_id)
+    layout = page.layout if page else html.H2("Error, Please reload.")
+    return json.loads(to_json_plotly(layout))
+
+
+def active_tab():
+    triggered_id = dash.callback_context.triggered_id
+    return triggered_id.replace('tab-icon-', '') if triggered_id else '1'
+
+
+if KEEP_ALIVE_TABS:
+    @app.callback(
+        [Output(f'tab-pane-{tab_id}', 'children') for tab_id in PAGES],
+        [Output(f'tab-pane-{tab_id}', 'style') for tab_id in PAGES],
+        Output('mounted-tabs', 'data'),
+        tab_icon_inputs,
+        State('mounted-tabs', 'data')
+    )
+    def render_page_content(*args):
+        tab_id = active_tab()
+        previous = args[-1] or []
+
+        # least recently visited first; whatever falls off the front is unmounted
+        visited = [t for t in previous if t != tab_id] + [tab_id]
+        mounted = visited[-KEEP_ALIVE_TABS:]
+
+        children = [
+            page_layout(t) if t == tab_id and t not in previous
+            else [] if t in previous and t not in mounted
+            else dash.no_update
+            for t in PAGES
+        ]
+        styles = [{'display': 'block' if t == tab_id else 'none'} for t in PAGES]
+        return children + styles + [mounted]
+else:
+    @app.callback(
+        Output('page-content', 'children'),
+        tab_icon_inputs
+    )
+    def render_page_content(*args):
+        return page_layout(active_tab())
+
+
+# theme switcher (browser side: a store flip and a stylesheet href)
+app.clientside_callback(
+    """
+    function(n_clicks, current_theme) {
+        const new_theme = current_theme === 'dark' ? 'light' : 'dark';
+        return [new_theme, `/assets/${new_theme}.css`];
+    }
+    """,
     Output('current-theme', 'data'),
     Output('theme-link', 'href'),
     Input('theme-switcher', 'n_clicks'),
     State('current-theme', 'data'),
     prevent_initial_call=True
 )
-def switch_theme(n_clicks, current_theme):
-    if current_theme == 'dark':
-        new_theme = 'light'
-        new_css_href = '/assets/light.css'
-    else:
-        new_theme = 'dark'
-        new_css_href = '/assets/dark.css'
-        
-    return new_theme, new_css_href
 
 trend.register_trend_callbacks(app)
+metrics.install(app)
+profiling.install(app)
 
 if __name__ == '__main__':
     app.run(debug=True)
@@ -0,0 +1,125 @@
+from collections import namedtuple
+from contextvars import copy_context
+
+import numpy as np
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+# Representative inputs for every server-side callback, called directly (no HTTP, no JSON).
+# `triggered` is what dash.ctx.triggered_id reports during the call; None is the initial call.
+Case = namedtuple('Case', 'name function args triggered')
+
+
+def invoke(case):
+    """Run a case's callback inside a minimal callback context, as Dash's dispatcher would."""
+    def run():
+        triggered = [{'prop_id': f'{case.triggered}.value', 'value': None}] if case.triggered else []
+        context_value.set(AttributeDict(triggered_inputs=triggered, inputs_list=[], states_list=[],
+                                        outputs_list=[], input_values={}, state_values={}))
+        return case.function(*case.args)
+    return copy_context().run(run)
+
+
+def content_cases():
+    from tabs import content
+
+    years = [int(content.df['release_year'].min()), int(content.df['release_year'].max())]
+    recent = [years[1] - 10, years[1]]
+    cases = []
+    for search in ('', 'love', 'kher', 'zzzz'):
+        cases.append(Case(f'content.update_table search={search!r}', content.update_table,
+                          (search, 'all', 'all', 'all', 'all', years, 'title_asc', 0), None))
+    cases.append(Case('content.update_table filtered', content.update_table,
+                      ('', 'Movie', 'India', 'Dramas', 'TV-14', recent, 'year_desc', 0), None))
+    return cases
+
+
+def genre_cases():
+    from tabs import genre_intelligence
+
+    years = [int(genre_intelligence.df['release_year'].min()), int(genre_intelligence.df['release_year'].max())]
+    recent = [years[1] - 10, years[1]]
+    cases = []
+    for type_, country, rating, year_range in (('all', 'all', 'all', years),
+                                               ('Movie', 'all', 'all', years),
+                                               ('all', 'India', 'all', years),
+                                               ('TV Show', 'United States', 'TV-MA', recent)):
+        cases.append(Case(f'genre.update_genre_tab {type_}/{country}/{rating}/{year_range[0]}',
+                          genre_intelligence.update_genre_tab, (type_, country, rating, year_range, 'dark'), None))
+    return cases
+
+
+def trend_cases():
+    from tabs import trend
+
+    return [Case(f'trend.update_trend_charts {type_}', trend.update_trend_charts, (type_, 'dark'), None)
+            for type_ in ('all', 'Movie', 'TV Show')]
+
+
+def exec_cases():
+    from tabs import exec_overview
+
+    years = [int(exec_overview.YEARS.min()), int(exec_overview.YEARS.max())]
+    recent = [years[1] - 10, years[1]]
+    return [
+        Case('exec.update_overview all', exec_overview.update_overview, ('all', years, 'all', 'dark'), None),
+        Case('exec.update_overview Movie/India', exec_overview.update_overview,
+             ('Movie', recent, 'India', 'dark'), None),
+        Case('exec.restyle_overview', exec_overview.restyle_overview, ('light',), 'current-theme'),
+    ]
+
+
+def geo_cases():
+    from tabs import geo_insights
+
+    return [
+        Case('geo.update_all_themes mount', geo_insights.update_all_themes, ('light',), None),
+        Case('geo.update_all_themes switch', geo_insights.update_all_themes, ('light',), 'current-theme'),
+    ]
+
+
+def creator_cases():
+    from tabs import creator_talent
+
+    top = [row['name'] for row in creator_talent.leaderboard('degree', size=2)]
+    cases = []
+    for query in ('a', 'kh', 'john'):
+        cases.append(Case(f'creator.update_creator_options {query!r}', creator_talent.update_creator_options,
+                          (query, top[0]), None))
+    cases.append(Case('creator.update_target_options', creator_talent.update_target_options, ('sam', None), None))
+    for name in top:
+        cases.append(Case(f'creator.update_creator_views {name}', creator_talent.update_creator_views,
+                          (name, 'dark', 1, None), 'creator-search'))
+    # someone who shares no title with anyone else (regression: similarity used to fail on an empty row)
+    loner = creator_talent.PEOPLE[int(np.flatnonzero(np.diff(creator_talent.COLLAB.indptr) == 0)[0])]
+    cases.append(Case('creator.update_creator_views no collaborators', creator_talent.update_creator_views,
+                      (loner, 'dark', 1, None), 'creator-search'))
+    cases.append(Case('creator.update_creator_views 2 hops', creator_talent.update_creator_views,
+                      (top[0], 'dark', 2, None), 'collab-hops'))
+    cases.append(Case('creator.update_creator_views path', creator_talent.update_creator_views,
+                      (top[0], 'dark', 1, top[1]), 'creator-target'))
+    for role in ('all', 'actor'):
+        cases.append(Case(f'creator.rising_stars {role}', creator_talent.rising_stars, (5, 3, role, 'dark'), None))
+    for metric in ('pagerank', 'betweenness'):
+        cases.append(Case(f'creator.update_leaderboard {metric}', creator_talent.update_leaderboard, (metric,), None))
+    return cases
+
+
+# one entry per tab, in the order they are run; each builder imports only its own tab
+TAB_CASES = {
+    'content': content_cases,
+    'genre': genre_cases,
+    'trend': trend_cases,
+    'exec': exec_cases,
+    'geo': geo_cases,
+    'creator': creator_cases,
+}
+
+
+def build_cases(tab):
+    """A tab's cases, built against whatever catalog it loaded (see NETFLIX_DATA).
+
+    Only that tab is imported, plus the shared figure templates, so a large catalog needs memory for
+    one tab's frames at a time rather than the whole app's."""
+    import tabs.theme  # noqa: F401  (registers the figure templates, as importing the app does)
+    return TAB_CASES[tab]()
@@ -0,0 +1,103 @@
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import MISSING, SOURCE_PATH, fit, generate, write_catalog
+
+# Checks the creator tab's integer-coded store (tabs/creator_talent.py) against a plain pandas
+# explode/drop_duplicates reference, on a synthetic catalog salted with the awkward cases: titles
+# shared by several shows, multi-name director fields, a name repeated within one list, stray
+# whitespace around names, and the missing-value placeholder.
+#   python -m benchmarks.check_creator_store --rows 3000
+# Compared: credits, person-show pairs, titles per person and every collaboration edge weight.
+
+
+def salted_catalog(rows, seed):
+    rng = np.random.default_rng(seed)
+    df = generate(fit(pd.read_csv(SOURCE_PATH)), rows, seed)
+    shared = rng.choice(rows, size=(rows * 2 // 5, 2))
+    df.loc[shared[:, 0], 'title'] = df['title'].to_numpy()[shared[:, 1]]
+    for column in ('director', 'cast'):
+        named = np.flatnonzero(df[column].to_numpy() != MISSING)
+        repeated = rng.choice(named, size=len(named) // 10, replace=False)
+        df.loc[repeated, column] += ', ' + df.loc[repeated, column].str.split(',').str[0]
+        spaced = rng.choice(named, size=len(named) // 10, replace=False)
+        df.loc[spaced, column] = ' ' + df.loc[spaced, column].str.replace(', ', ' ,  ') + ' '
+    # directors listed as one comma-separated field
+    co_directed = rng.choice(np.flatnonzero(df['director'].to_numpy() != MISSING), size=rows // 20, replace=False)
+    df.loc[co_directed, 'director'] += ', ' + df['director'].sample(len(co_directed), random_state=seed).to_numpy()
+    return df
+
+
+def reference(df):
+    """(credits, pairs, titles per person, edge weights) computed with pandas, one row per fact."""
+    df = df.fillna('')
+    credits = []
+    for column, role in (('director', 'Director'), ('cast', 'Actor')):
+        names = df[column].str.split(',').explode().str.strip()
+        names = names[(names != '') & (names != MISSING)]
+        credits.append(pd.DataFrame({'row': names.index, 'name': names.to_numpy(), 'role': role}))
+    credits = pd.concat(credits).drop_duplicates(ignore_index=True)
+    pairs = credits[['row', 'name']].drop_duplicates(ignore_index=True)
+    titles = pairs.groupby('name').size()
+    edges = pairs.merge(pairs, on='row')
+    edges = edges[edges['name_x'] != edges['name_y']].groupby(['name_x', 'name_y']).size()
+    return credits, pairs, titles, edges
+
+
+def store(ct):
+    """The same four facts read back out of the creator store."""
+    credits = pd.DataFrame({'row': ct.creators_df['row'].to_numpy(), 'name': ct.creators_df['name'].astype(str),
+                            'role': ct.creators_df['role'].astype(str)})
+    sizes = np.diff(ct.TITLE_PEOPLE.indptr)
+    pairs = pd.DataFrame({'row': np.repeat(np.arange(len(sizes)), sizes),
+                          'name': ct.PEOPLE[ct.TITLE_PEOPLE.indices]})
+    titles = pd.Series(np.diff(ct.NAME_TITLES.indptr), index=ct.PEOPLE)
+    degree = np.diff(ct.COLLAB.indptr)
+    edges = pd.Series(ct.COLLAB_WEIGHTS, index=pd.MultiIndex.from_arrays(
+        [ct.PEOPLE[np.repeat(np.arange(len(degree)), degree)], ct.PEOPLE[ct.COLLAB.indices]]))
+    return credits, pairs, titles, edges
+
+
+def same_rows(a, b):
+    key = list(a.columns)
+    return a.sort_values(key, ignore_index=True).equals(b[key].astype(a.dtypes).sort_values(key, ignore_index=True))
+
+
+def same_counts(a, b):
+    a, b = a[a > 0].sort_index(), b[b > 0].sort_index()
+    return a.index.equals(b.index) and (a.to_numpy() == b.to_numpy()).all()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the creator store against a pandas reference.')
+    parser.add_argument('--rows', type=int, default=3000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    df = salted_catalog(args.rows, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['NETFLIX_DATA'] = path = os.path.join(directory, 'catalog.pkl')
+        write_catalog(df, path)
+        # the tab builds its store at import, from NETFLIX_DATA
+        from tabs import creator_talent
+
+    expected, actual = reference(df), store(creator_talent)
+    checks = {
+        'credits': same_rows(expected[0], actual[0]),
+        'person-show pairs': same_rows(expected[1], actual[1]),
+        'titles per person': same_counts(expected[2], actual[2]),
+        'collaboration edges': same_counts(expected[3], actual[3]),
+    }
+    print(f'{args.rows:,} rows, {len(expected[0]):,} credits, {len(expected[3]):,} edges')
+    for name, ok in checks.items():
+        print(f'  {name:20} {"ok" if ok else "MISMATCH"}')
+    return 0 if all(checks.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,350 @@
+import argparse
+import http.client
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import numpy as np
+
+# Load tests from recorded callback traffic.
+#   python -m benchmarks.loadtest record --out session.jsonl        # click around at :8050, Ctrl+C to stop
+#   python -m benchmarks.loadtest script --out session.jsonl        # or a scripted walk through every tab
+#   python -m benchmarks.loadtest replay session.jsonl --users 16 --workers 2 --threads 4 --duration 60
+# A recording is one JSON line per /_dash-update-component request body. Replay starts gunicorn on
+# `app:server` (or targets --url), and each simulated user walks the recording from a random point
+# with exponential think time between requests. When it started gunicorn, replay also reports each
+# worker's unique (USS) and proportional (PSS) memory at the end of the run; compare with --preload.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DISPATCH_PATH = '/_dash-update-component'
+
+
+# ---------- Recording ----------
+def record_requests(server, path):
+    """Append every callback request body reaching `server` to the JSONL file at `path`."""
+    from flask import request
+    lock = threading.Lock()
+
+    @server.before_request
+    def _record():
+        if request.path.endswith(DISPATCH_PATH):
+            line = json.dumps(request.get_json(silent=True), separators=(',', ':'))
+            with lock, open(path, 'a') as f:
+                f.write(line + '\n')
+
+
+def request_body(dependency, values, triggered=None):
+    """The body the browser would send for `dependency`, with input/state values from `values` ('id.prop' keys)."""
+    def bind(items):
+        return [dict(item, value=values.get(f"{item['id']}.{item['property']}")) for item in items]
+    outputs = [dict(zip(('id', 'property'), out.split('@')[0].rsplit('.', 1)))
+               for out in dependency['output'].strip('.').split('...')]
+    return {
+        'output': dependency['output'],
+        'outputs': outputs if len(outputs) > 1 else outputs[0],
+        'inputs': bind(dependency['inputs']),
+        'state': bind(dependency['state']),
+        'changedPropIds': [triggered] if triggered else [],
+    }
+
+
+def scripted_session():
+    """(output, input id, values, triggered) steps: every tab opened, filtered, searched and re-themed."""
+    tabs = {f'tab-icon-{i}.n_clicks': None for i in range(1, 8)}
+    steps = []
+
+    # the router's outputs depend on KEEP_ALIVE_TABS, so it is found by its input alone (output None)
+    def open_tab(i):
+        steps.append((None, 'tab-icon-1', dict(tabs, **{f'tab-icon-{i}.n_clicks': 1}), f'tab-icon-{i}.n_clicks'))
+
+    for theme in ('dark', 'light'):
+        open_tab(1)
+        for type_, years, country in (('all', [1925, 2021], 'all'), ('Movie', [2010, 2021], 'India'),
+                                      ('TV Show', [2000, 2021], 'United States')):
+            steps.append(('type-pie', 'exec-type', {'exec-type.value': type_, 'exec-year.value': years,
+                                                      'exec-country.value': country, 'current-theme.data': theme},
+                          'exec-type.value'))
+        steps.append(('type-pie', 'current-theme', {'current-theme.data': theme}, 'current-theme.data'))
+
+        open_tab(2)
+        for search, type_, sort_by in (('', 'all', 'title_asc'), ('love', 'all', 'year_desc'),
+                                       ('kher', 'Movie', 'title_asc')):
+            steps.append(('content-table', 'search-title', {
+                'search-title.value': search, 'filter-type.value': type_, 'filter-country.value': 'all',
+                'filter-genre.value': 'all', 'filter-rating.value': 'all', 'year-range.value': [1925, 2021],
+                'sort-by.value': sort_by, 'stats-button.n_clicks': 0}, 'search-title.value'))
+
+        open_tab(3)
+        for type_ in ('all', 'Movie'):
+            steps.append(('trend-growth-graph', 'trend-type-dropdown', {
+                'trend-type-dropdown.value': type_, 'current-theme.data': theme}, 'trend-type-dropdown.value'))
+
+        open_tab(4)
+        steps.append(('fig_world', 'current-theme', {'current-theme.data': theme}, 'current-theme.data'))
+
+        open_tab(5)
+        for type_, country in (('all', 'all'), ('Movie', 'India')):
+            steps.append(('genre-top-chart', 'genre-type', {
+                'genre-type.value': type_, 'genre-country.value': country, 'genre-rating.value': 'all',
+                'genre-year.value': [1925, 2021], 'current-theme.data': theme}, 'genre-type.value'))
+
+        open_tab(6)
+        steps.append(('creator-search.options', 'creator-search', {'creator-search.search_value': 'sha'},
+                      'creator-search.search_value'))
+        for name, hops, target in (('Anupam Kher', 1, None), ('Shah Rukh Khan', 2, None),
+                                   ('Anupam Kher', 1, 'Samuel L. Jackson')):
+            steps.append(('collab-graph', 'creator-search', {
+                'creator-search.value': name, 'current-theme.data': theme, 'collab-hops.value': hops,
+                'creator-target.value': target}, 'creator-search.value'))
+        steps.append(('rising-stars-bar', 'rising-window', {
+            'rising-window.value': 5, 'rising-min-titles.value': 3, 'rising-role.value': 'all',
+            'current-theme.data': theme}, 'rising-window.value'))
+        steps.append(('centrality-table', 'centrality-metric', {'centrality-metric.value': 'betweenness'},
+                      'centrality-metric.value'))
+    return steps
+
+
+def find_dependency(dependencies, output, input_id):
+    """The callback writing `output` from `input_id`; with output None, the server-side one reading `input_id`."""
+    for dependency in dependencies:
+        if output is None and dependency.get('clientside_function'):
+            continue
+        if (output is None or output in dependency['output']) and any(i['id'] == input_id for i in dependency['inputs']):
+            return dependency
+    raise LookupError(f'no callback writes {output or "anything"!r} from {input_id!r}')
+
+
+def record_script(path):
+    """Run scripted_session() through the Flask test client, recording the request bodies."""
+    sys.path.insert(0, ROOT)
+    import app
+    record_requests(app.server, path)
+    client = app.server.test_client()
+    dependencies = json.loads(client.get('/_dash-dependencies').data)
+    # what the callbacks have returned so far, as the browser would hold it (e.g. the mounted keep-alive tabs)
+    current = {}
+    for output, input_id, values, triggered in scripted_session():
+        body = request_body(find_dependency(dependencies, output, input_id), {**current, **values}, triggered)
+        response = client.post(DISPATCH_PATH, json=body)
+        if response.status_code >= 400:
+            print(f'warning: {output or input_id} answered {response.status_code}', file=sys.stderr)
+        elif response.status_code == 200:
+            for component, props in response.get_json()['response'].items():
+                current.update((f'{component}.{prop}', value) for prop, value in props.items())
+
+
+def record_live(path, port):
+    """Serve the app on `port`, recording what a browser sends, until interrupted."""
+    sys.path.insert(0, ROOT)
+    import app
+    record_requests(app.server, path)
+    print(f'recording callback requests to {path}; open http://127.0.0.1:{port}, Ctrl+C to stop', file=sys.stderr)
+    app.app.run(port=port, debug=False)
+
+
+# ---------- Replay ----------
+def start_gunicorn(port, workers, threads, preload):
+    command = [sys.executable, '-m', 'gunicorn', 'app:server', '--bind', f'127.0.0.1:{port}',
+               '--workers', str(workers), '--threads', str(threads), '--timeout', '120']
+    # preloading goes through gunicorn.conf.py, which also freezes the master's objects before forking
+    env = dict(os.environ, DASH_PRELOAD='1' if preload else '')
+    # a file rather than a pipe: nothing drains gunicorn's log while the test runs
+    log = tempfile.TemporaryFile()
+    server = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=log)
+    deadline = time.time() + 300  # the tabs precompute at import
+    while time.time() < deadline:
+        if server.poll() is not None:
+            log.seek(0)
+            raise RuntimeError('gunicorn exited:\n' + log.read().decode(errors='replace')[-2000:])
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.request('GET', '/_dash-layout')
+            if connection.getresponse().status == 200:
+                return server
+        except OSError:
+            pass
+        time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError('gunicorn did not come up')
+
+
+def server_memory(master_pid):
+    """{'master': memory, '<worker pid>': memory, ...} for a running gunicorn (see metrics.process_memory)."""
+    from metrics import process_memory
+    try:
+        with open(f'/proc/{master_pid}/task/{master_pid}/children') as f:
+            workers = f.read().split()
+    except OSError:
+        return {}
+    memory = {'master': process_memory(master_pid)}
+    memory.update((pid, process_memory(pid)) for pid in workers)
+    return {name: m for name, m in memory.items() if m}
+
+
+def warm_up(url, bodies, connections):
+    """A pass over the recording on each of `connections` parallel connections, so that every worker has
+    filled its lazy caches before anything is measured."""
+    host = urlsplit(url)
+
+    def one_pass():
+        connection = http.client.HTTPConnection(host.hostname, host.port, timeout=120)
+        for body in bodies:
+            connection.request('POST', host.path.rstrip('/') + DISPATCH_PATH, body,
+                               {'Content-Type': 'application/json'})
+            connection.getresponse().read()
+
+    threads = [threading.Thread(target=one_pass) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def simulate_user(url, bodies, think, stop, seed, samples):
+    rng = random.Random(seed)
+    host = urlsplit(url)
+    path = host.path.rstrip('/') + DISPATCH_PATH
+    connection = http.client.HTTPConnection(host.hostname, host.port, timeout=120)
+    i = rng.randrange(len(bodies))
+    while not stop.is_set():
+        output, body = bodies[i]
+        started = time.perf_counter()
+        ok = False
+        # like a browser, retry once on a fresh connection: the server drops idle keep-alive connections
+        for _ in range(2):
+            try:
+                connection.request('POST', path, body, {'Content-Type': 'application/json'})
+                response = connection.getresponse()
+                response.read()
+                ok = response.status < 400
+                break
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection(host.hostname, host.port, timeout=120)
+        samples.append((output, time.perf_counter() - started, ok))
+        i = (i + 1) % len(bodies)
+        if think:
+            stop.wait(rng.expovariate(1 / think))
+
+
+def replay(bodies, url, users, think, duration, warmup):
+    if warmup:
+        warm_up(url, [body for _, body in bodies], warmup)
+    samples, stop = [], threading.Event()
+    threads = [threading.Thread(target=simulate_user, args=(url, bodies, think, stop, seed, samples), daemon=True)
+               for seed in range(users)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples, elapsed):
+    per_callback = defaultdict(list)
+    for output, seconds, ok in samples:
+        per_callback[output].append((seconds, ok))
+
+    def stats(rows):
+        latency = np.array([seconds for seconds, _ in rows]) * 1e3
+        p50, p95, p99 = np.percentile(latency, [50, 95, 99])
+        errors = sum(not ok for _, ok in rows)
+        return dict(requests=len(rows), rps=round(len(rows) / elapsed, 2), p50_ms=round(p50, 1),
+                    p95_ms=round(p95, 1), p99_ms=round(p99, 1), error_rate=round(errors / len(rows), 4))
+
+    return {'total': stats([(s, ok) for _, s, ok in samples]),
+            'callbacks': {output: stats(rows) for output, rows in
+                          sorted(per_callback.items(), key=lambda item: -len(item[1]))}}
+
+
+def report(summary, config):
+    print(' '.join(f'{k}={v}' for k, v in config.items()))
+    print(f'{"callback":64} {"requests":>8} {"req/s":>7} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"errors":>7}')
+    rows = list(summary['callbacks'].items()) + [('TOTAL', summary['total'])]
+    for output, s in rows:
+        print(f'{output[:64]:64} {s["requests"]:8} {s["rps"]:7.1f} {s["p50_ms"]:8.1f} {s["p95_ms"]:8.1f} '
+              f'{s["p99_ms"]:8.1f} {s["error_rate"]:7.1%}')
+    if summary.get('memory'):
+        print(f'\n{"process":12} {"USS MiB":>9} {"PSS MiB":>9} {"RSS MiB":>9}')
+        for name, m in summary['memory'].items():
+            print(f'{name:12} {m["uss"] / 2 ** 20:9.1f} {m["pss"] / 2 ** 20:9.1f} {m["rss"] / 2 ** 20:9.1f}')
+
+
+def load_session(path):
+    with open(path) as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    return [(body['output'], json.dumps(body, separators=(',', ':'))) for body in lines]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Record and replay Dash callback traffic.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    live = commands.add_parser('record', help='serve the app and record what a browser sends')
+    live.add_argument('--out', required=True)
+    live.add_argument('--port', type=int, default=8050)
+
+    script = commands.add_parser('script', help='record a scripted walk through every tab')
+    script.add_argument('--out', required=True)
+
+    run = commands.add_parser('replay', help='replay a recording against gunicorn')
+    run.add_argument('session')
+    run.add_argument('--url', help='target an already running server instead of starting gunicorn')
+    run.add_argument('--port', type=int, default=8051)
+    run.add_argument('--workers', type=int, default=2)
+    run.add_argument('--threads', type=int, default=1)
+    run.add_argument('--preload', action='store_true', help='start gunicorn with DASH_PRELOAD=1 (see gunicorn.conf.py)')
+    run.add_argument('--users', type=int, default=8)
+    run.add_argument('--think', type=float, default=1.0, help='mean seconds between a user\'s requests')
+    run.add_argument('--duration', type=float, default=60)
+    run.add_argument('--no-warmup', dest='warmup', action='store_false')
+    run.add_argument('--json', help='also write the summary here')
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        return record_live(args.out, args.port)
+    if args.command == 'script':
+        return record_script(args.out)
+
+    bodies = load_session(args.session)
+    server = None
+    memory = {}
+    url = args.url
+    if url is None:
+        server = start_gunicorn(args.port, args.workers, args.threads, args.preload)
+        url = f'http://127.0.0.1:{args.port}'
+    try:
+        warmup = (args.workers if server is not None else args.users) if args.warmup else 0
+        samples, elapsed = replay(bodies, url, args.users, args.think, args.duration, warmup)
+        if server is not None:
+            # after the run, so the workers' lazy caches and any copy-on-write they caused are counted
+            memory = server_memory(server.pid)
+    finally:
+        if server is not None:
+            server.send_signal(signal.SIGTERM)
+            server.wait()
+
+    config = dict(url=url, users=args.users, think=args.think, duration=args.duration)
+    if server is not None:
+        config.update(workers=args.workers, threads=args.threads, preload=args.preload)
+    summary = summarize(samples, elapsed)
+    if memory:
+        summary['memory'] = memory
+    report(summary, config)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(dict(config=config, **summary), f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+
+from benchmarks.cases import TAB_CASES
+from benchmarks.synthetic import catalog_path
+
+# Callback benchmarks over synthetic catalogs of 1x, 10x and 100x the real one (benchmarks/synthetic.py).
+#   python -m benchmarks.run                       # 1x, 10x, 100x against benchmarks/baseline.json
+#   python -m benchmarks.run --scales 1 10 --save-baseline
+# Each tab at each scale runs in a fresh interpreter (the tabs build their frames at import), pointed
+# at the scaled catalog through NETFLIX_DATA. At 100x the whole app does not fit in a few GB, one tab does.
+# A requested scale that cannot be measured (a worker killed or failing) fails the run, baseline or not.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+# a case regresses when its p50 or peak memory grows by more than the tolerance and by more than
+# these floors, so sub-millisecond jitter on fast callbacks is not reported
+NOISE_MS = 1.0
+NOISE_KIB = 256
+MIN_REPEAT = 3
+
+
+def measure(case, repeat, budget):
+    from benchmarks.cases import invoke
+
+    started = time.perf_counter()
+    invoke(case)
+    cold = time.perf_counter() - started
+
+    # `repeat` warm calls, fewer (but at least MIN_REPEAT) when they would take longer than `budget` seconds
+    times = []
+    while len(times) < repeat and (len(times) < MIN_REPEAT or sum(times) < budget):
+        started = time.perf_counter()
+        invoke(case)
+        times.append(time.perf_counter() - started)
+
+    # memory in its own pass: tracemalloc slows allocation-heavy code down several times
+    tracemalloc.start()
+    invoke(case)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    p50, p95 = np.percentile(times, [50, 95]) * 1e3
+    return dict(cold_ms=round(cold * 1e3, 3), p50_ms=round(p50, 3), p95_ms=round(p95, 3),
+                peak_kib=round(peak / 1024, 1))
+
+
+def run_worker(tab, repeat, budget, only):
+    """Import one tab against NETFLIX_DATA, measure its cases, print the results as JSON."""
+    warnings.filterwarnings('ignore')
+    stdout, sys.stdout = sys.stdout, sys.stderr  # keep stray prints out of the JSON
+    started = time.perf_counter()
+    from benchmarks.cases import build_cases
+    cases = build_cases(tab)
+    results = {f'import {tab}': dict(seconds=round(time.perf_counter() - started, 2),
+                              max_rss_mib=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1))}
+    for case in cases:
+        if only and only not in case.name:
+            continue
+        results[case.name] = measure(case, repeat, budget)
+        print(f'  {case.name}: {results[case.name]["p50_ms"]:.2f} ms', file=sys.stderr)
+    stdout.write(json.dumps(results))
+
+
+def run_tab(path, tab, repeat, budget, only):
+    env = dict(os.environ, NETFLIX_DATA=path)
+    command = [sys.executable, '-m', 'benchmarks.run', '--worker', tab, '--repeat', str(repeat),
+               '--budget', str(budget)]
+    if only:
+        command += ['--only', only]
+    worker = subprocess.run(command, cwd=ROOT, env=env, stdout=subprocess.PIPE)
+    if worker.returncode:
+        # e.g. SIGKILL from the OOM killer while the tab builds its frames
+        reason = f'signal {-worker.returncode}' if worker.returncode < 0 else f'exit status {worker.returncode}'
+        return {f'import {tab}': dict(error=f'worker died with {reason}')}
+    return json.loads(worker.stdout)
+
+
+def run_scale(scale, tabs, repeat, budget, only, seed):
+    path = catalog_path(scale, seed)
+    results = {}
+    for tab in tabs:
+        print(f'  {tab} ...', file=sys.stderr)
+        results.update(run_tab(path, tab, repeat, budget, only))
+    return results
+
+
+def failures(results):
+    return [f'{scale} {name}: {now["error"]}' for scale, cases in results.items()
+            for name, now in cases.items() if 'error' in now]
+
+
+def regressions(results, baseline, tolerance):
+    found = []
+    for scale, cases in results.items():
+        for name, now in cases.items():
+            before = baseline.get(scale, {}).get(name)
+            if before is None or name.startswith('import') or 'error' in now:
+                continue
+            for key, floor in (('p50_ms', NOISE_MS), ('peak_kib', NOISE_KIB)):
+                if now[key] > before[key] * (1 + tolerance) and now[key] - before[key] > floor:
+                    found.append(f'{scale} {name}: {key} {before[key]:g} -> {now[key]:g}')
+    return found
+
+
+def report(results, baseline):
+    for scale, cases in results.items():
+        print(f'\n== {scale}')
+        for name, imported in cases.items():
+            if not name.startswith('import'):
+                continue
+            if 'error' in imported:
+                print(f'{name:58} FAILED: {imported["error"]}')
+            else:
+                print(f'{name:58} {imported["seconds"]:9.2f} s, max RSS {imported["max_rss_mib"]:9.1f} MiB')
+        print(f'{"case":58} {"cold ms":>9} {"p50 ms":>9} {"p95 ms":>9} {"peak KiB":>10} {"p50 vs base":>12}')
+        for name, r in cases.items():
+            if name.startswith('import'):
+                continue
+            before = baseline.get(scale, {}).get(name)
+            delta = f'{(r["p50_ms"] / before["p50_ms"] - 1) * 100:+.0f}%' if before and before['p50_ms'] else ''
+            print(f'{name[:58]:58} {r["cold_ms"]:9.2f} {r["p50_ms"]:9.2f} {r["p95_ms"]:9.2f} '
+                  f'{r["peak_kib"]:10.1f} {delta:>12}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the dashboard callbacks on scaled catalogs.')
+    parser.add_argument('--scales', type=float, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=15, help='warm calls per case')
+    parser.add_argument('--budget', type=float, default=10, help='seconds of warm calls per case, at most')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--tabs', nargs='+', choices=list(TAB_CASES), default=list(TAB_CASES),
+                        help='only these tabs (each is imported in its own worker)')
+    parser.add_argument('--only', help='only cases whose name contains this')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown')
+    parser.add_argument('--save-baseline', action='store_true', help='write these results as the baseline')
+    parser.add_argument('--worker', choices=list(TAB_CASES), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return run_worker(args.worker, args.repeat, args.budget, args.only)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    for scale in args.scales:
+        print(f'running {scale:g}x ...', file=sys.stderr)
+        results[f'{scale:g}x'] = run_scale(scale, args.tabs, args.repeat, args.budget, args.only, args.seed)
+    report(results, baseline)
+
+    failed = failures(results)
+    if failed:
+        print(f'\n{len(failed)} requested tab(s) could not be measured:', file=sys.stderr)
+        print('\n'.join(f'  {line}' for line in failed), file=sys.stderr)
+
+    if args.save_baseline:
+        # a scale with a missing tab is left out, so later runs keep comparing it against its last full baseline
+        complete = {scale: cases for scale, cases in results.items() if not failures({scale: cases})}
+        with open(args.baseline, 'w') as f:
+            json.dump({**baseline, **{scale: {**baseline.get(scale, {}), **cases}
+                                      for scale, cases in complete.items()}}, f, indent=1)
+        print(f'\nbaseline written to {args.baseline} for {", ".join(complete) or "no scale"}')
+        return 1 if failed else 0
+
+    found = regressions(results, baseline, args.tolerance)
+    if found:
+        print(f'\n{len(found)} regression(s) beyond {args.tolerance:.0%}:')
+        print('\n'.join(f'  {line}' for line in found))
+    return 1 if failed or found else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,225 @@
+import argparse
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Synthetic catalogs in the netflix_titles.csv schema, drawn from distributions fitted to the real one:
+#   type mix; per type: genre combinations together with their description and rating, the joint
+#   (release_year, date_added), durations, and the number of countries, directors and cast members;
+#   country popularity; director and actor popularity as finite Zipf laws whose pools grow with the
+#   catalog (Heaps' law), so a 100x catalog has more people rather than the same people 100x as busy.
+#   python -m benchmarks.synthetic --rows 1000000 --out catalog.pkl
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(os.path.dirname(BENCHMARK_DIR), 'data', 'netflix_titles.csv')
+CACHE_DIR = os.path.join(BENCHMARK_DIR, 'data')
+MISSING = 'Unknown (API Not Found)'
+# part of every cached catalog's file name: bump it whenever a change to fit() or generate() changes the
+# output, so catalogs written by an older generator are regenerated rather than reused
+GENERATOR_VERSION = 2
+COLUMNS = ['show_id', 'type', 'title', 'director', 'cast', 'country', 'date_added', 'release_year', 'rating',
+           'duration', 'listed_in', 'description', 'season_count', 'duration_min']
+
+# a person pool: real names in popularity order, the Zipf exponent, the fitted pool size and growth rate
+People = namedtuple('People', 'names exponent pool growth')
+CatalogModel = namedtuple('CatalogModel', 'source size types type_rows counts countries country_weights people')
+
+
+def value_counts(series, sep=','):
+    """Counts of the individual values of a delimited column, most common first, placeholder excluded."""
+    values = series[series != MISSING].str.split(sep).explode().str.strip()
+    return values[values != ''].value_counts()
+
+
+def per_row(series, sep=','):
+    """Number of delimited values in each row (0 for the placeholder)."""
+    return np.where(series.eq(MISSING) | series.isna(), 0, series.fillna('').str.count(sep) + 1)
+
+
+def fit_zipf(counts, samples):
+    """(exponent, pool size) of the finite Zipf law that best reproduces, from `samples` draws, both the
+    number of distinct people and the popularity of the top ten."""
+    distinct, top = len(counts), counts[:10].mean()
+    best = (np.inf, distinct, 1.0)
+    for pool in (distinct * np.geomspace(1, 30, 24)).astype(np.int64):
+        log_rank = np.log(np.arange(1, pool + 1))
+        for exponent in np.linspace(0.2, 1.3, 23):
+            w = np.exp(-exponent * log_rank)
+            w /= w.sum()
+            expected_distinct = -np.expm1(samples * np.log1p(-w)).sum()
+            err = np.log(expected_distinct / distinct) ** 2 + np.log(samples * w[:10].mean() / top) ** 2
+            if err < best[0]:
+                best = (err, pool, exponent)
+    return best[2], int(best[1])
+
+
+def heaps_growth(series, seed=0):
+    """Exponent b of distinct(n) ~ n**b, from the distinct people in half of the rows vs all of them."""
+    half = series.sample(frac=0.5, random_state=seed)
+    return float(np.log(len(value_counts(series)) / len(value_counts(half))) / np.log(2))
+
+
+def fit_people(series):
+    counts = value_counts(series)
+    exponent, pool = fit_zipf(counts.to_numpy(), int(counts.sum()))
+    return People(counts.index.to_numpy(dtype=object), exponent, pool, heaps_growth(series))
+
+
+def fit(df):
+    """A CatalogModel of `df` (the netflix_titles.csv columns)."""
+    types, type_codes = np.unique(df['type'].to_numpy(dtype=str), return_inverse=True)
+    counts = {column: per_row(df[column]) for column in ('director', 'cast', 'country')}
+    countries = value_counts(df['country'])
+    return CatalogModel(
+        source=df.reset_index(drop=True),
+        size=len(df),
+        types=types,
+        type_rows=[np.flatnonzero(type_codes == t) for t in range(len(types))],
+        counts=counts,
+        countries=countries.index.to_numpy(dtype=object),
+        country_weights=(countries / countries.sum()).to_numpy(),
+        people={'director': fit_people(df['director']), 'cast': fit_people(df['cast'])},
+    )
+
+
+def same_type_rows(model, type_codes, rng):
+    """A random real row of the same type for every synthetic row."""
+    rows = np.empty(len(type_codes), dtype=np.int64)
+    for t, candidates in enumerate(model.type_rows):
+        mask = type_codes == t
+        rows[mask] = candidates[rng.integers(0, len(candidates), mask.sum())]
+    return rows
+
+
+def synthetic_names(names, ranks):
+    """Names for pool ranks past the real people: real first and last names recombined."""
+    parts = pd.Series(names).str.split(' ')
+    first = parts.str[0].drop_duplicates().to_numpy(dtype=object)
+    last = parts.str[-1].drop_duplicates().to_numpy(dtype=object)
+    i = ranks - len(names)
+    label = first[i % len(first)] + ' ' + last[(i // len(first)) % len(last)]
+    lap = i // (len(first) * len(last))
+    return np.where(lap > 0, label + ' ' + (lap + 1).astype(str).astype(object), label)
+
+
+def join_per_row(rows, labels, n):
+    """', '-joined labels per row (rows sorted), MISSING where a row has none."""
+    out = np.full(n, MISSING, dtype=object)
+    if len(rows):
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        out[rows[starts]] = [s[:-2] for s in np.add.reduceat(labels + ', ', starts)]
+    return out
+
+
+def distinct_per_row(rows, codes, n_codes):
+    """(rows, codes) with repeats of a code within a row dropped, sorted by row."""
+    keys = np.sort(rows.astype(np.int64) * n_codes + codes)
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+    return keys // n_codes, keys % n_codes
+
+
+def draw_people(people, sizes, scale, rng):
+    """Per-row joined names: `sizes[i]` distinct people drawn by Zipf popularity from a pool scaled to the catalog."""
+    pool = max(int(people.pool * scale ** people.growth), len(people.names))
+    weights = np.arange(1, pool + 1, dtype=np.float64) ** -people.exponent
+    rows = np.repeat(np.arange(len(sizes)), sizes)
+    # how often each person appears is one multinomial draw; shuffling deals the appearances out to titles
+    ranks = rng.permutation(np.repeat(np.arange(pool), rng.multinomial(len(rows), weights / weights.sum())))
+    rows, ranks = distinct_per_row(rows, ranks, pool)
+
+    # only the ranks actually drawn get a name
+    drawn = np.flatnonzero(np.bincount(ranks, minlength=pool))
+    labels = np.empty(len(drawn), dtype=object)
+    real = drawn < len(people.names)
+    labels[real] = people.names[drawn[real]]
+    labels[~real] = synthetic_names(people.names, drawn[~real])
+    position = np.zeros(pool, dtype=np.int64)
+    position[drawn] = np.arange(len(drawn))
+    return join_per_row(rows, labels[position[ranks]], len(sizes))
+
+
+def draw_countries(model, sizes, rng):
+    rows = np.repeat(np.arange(len(sizes)), sizes)
+    codes = rng.choice(len(model.countries), size=len(rows), p=model.country_weights)
+    rows, codes = distinct_per_row(rows, codes, len(model.countries))
+    return join_per_row(rows, model.countries[codes], len(sizes))
+
+
+def generate(model, n, seed=0):
+    """An `n`-row catalog in the source schema; the same model, n and seed give the same frame."""
+    rng = np.random.default_rng(seed)
+    src = model.source
+    type_share = np.array([len(rows) for rows in model.type_rows]) / model.size
+    type_codes = rng.choice(len(model.types), size=n, p=type_share)
+
+    # genres travel with their description and rating (genre co-occurrence, language keywords and
+    # kids/teen/adult mix stay together); dates, durations and list lengths come from other same-type rows
+    genre_rows = same_type_rows(model, type_codes, rng)
+    date_rows = same_type_rows(model, type_codes, rng)
+    duration_rows = same_type_rows(model, type_codes, rng)
+    size_rows = {column: same_type_rows(model, type_codes, rng) for column in model.counts}
+    scale = n / model.size
+
+    titles = src['title'].to_numpy(dtype=object)[genre_rows]
+    repeat = pd.Series(genre_rows).groupby(genre_rows).cumcount().to_numpy()
+    titles = np.where(repeat > 0, titles + ' (' + (repeat + 1).astype(str).astype(object) + ')', titles)
+
+    out = pd.DataFrame({
+        'show_id': 's' + pd.Series(np.arange(1, n + 1)).astype(str),
+        'type': model.types[type_codes],
+        'title': titles,
+        'director': draw_people(model.people['director'], model.counts['director'][size_rows['director']], scale, rng),
+        'cast': draw_people(model.people['cast'], model.counts['cast'][size_rows['cast']], scale, rng),
+        'country': draw_countries(model, model.counts['country'][size_rows['country']], rng),
+        'date_added': src['date_added'].to_numpy()[date_rows],
+        'release_year': src['release_year'].to_numpy()[date_rows],
+        'rating': src['rating'].to_numpy()[genre_rows],
+        'duration': src['duration'].to_numpy()[duration_rows],
+        'listed_in': src['listed_in'].to_numpy()[genre_rows],
+        'description': src['description'].to_numpy()[genre_rows],
+        'season_count': src['season_count'].to_numpy()[duration_rows],
+        'duration_min': src['duration_min'].to_numpy()[duration_rows],
+    })
+    return out[COLUMNS]
+
+
+def write_catalog(df, path):
+    """CSV, or a pickle (several times faster to load at millions of rows) for .pkl paths."""
+    if path.endswith('.pkl'):
+        df.to_pickle(path + '.tmp', compression=None)
+    else:
+        df.to_csv(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+
+
+def catalog_path(scale, seed=0, extension='.pkl'):
+    """Path of the synthetic `scale`x catalog, generated on first use and reused by this generator version."""
+    path = os.path.join(CACHE_DIR, f'synthetic-v{GENERATOR_VERSION}-x{scale:g}-seed{seed}{extension}')
+    if not os.path.exists(path):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        source = pd.read_csv(SOURCE_PATH)
+        write_catalog(generate(fit(source), int(round(len(source) * scale)), seed), path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write a synthetic catalog fitted to netflix_titles.csv.')
+    parser.add_argument('--rows', type=int, required=True)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', required=True, help='.csv, or .pkl for a pickled DataFrame')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    model = fit(pd.read_csv(SOURCE_PATH))
+    fitted = time.perf_counter()
+    df = generate(model, args.rows, args.seed)
+    generated = time.perf_counter()
+    write_catalog(df, args.out)
+    print(f'fit {fitted - started:.1f} s, generate {generated - fitted:.1f} s, '
+          f'write {time.perf_counter() - generated:.1f} s: {len(df):,} rows -> {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import gc
+import os
+
+from metrics import process_memory
+
+# Gunicorn settings, read automatically when gunicorn starts from this directory (gunicorn app:server).
+# With DASH_PRELOAD=1 the app is imported once in the master and the workers are forked from it, so
+# every catalog frame, exploded frame, network array and prebuilt figure the tabs compute at import is
+# shared copy-on-write instead of rebuilt in each worker. To keep those pages shared:
+#   - the collector stays off while the master imports, and everything alive before the fork is frozen
+#     into the permanent generation (gc.freeze), so collections in the workers never write to the
+#     shared objects' GC headers;
+#   - the layout caches are filled before the fork, so workers don't each build their own copy.
+# Object-dtype columns (titles, names) still have their strings' refcounts written when a callback
+# scans them, which un-shares those pages; numeric arrays and their buffers stay shared.
+# Each worker logs its unique (USS), proportional (PSS) and resident memory once it has booted.
+PRELOAD = os.environ.get('DASH_PRELOAD', '').lower() in ('1', 'true', 'yes', 'on')
+
+preload_app = PRELOAD
+
+if PRELOAD:
+    gc.disable()
+
+
+def when_ready(server):
+    """Runs in the master after the app is loaded, before the first worker is forked."""
+    if not PRELOAD:
+        return
+    import app
+    for tab_id in app.PAGES:
+        app.page_layout(tab_id)
+    gc.collect()
+    gc.freeze()
+    memory = process_memory()
+    if memory:
+        server.log.info('master preloaded: %s', _format(memory))
+
+
+def post_fork(server, worker):
+    if PRELOAD:
+        gc.enable()
+
+
+def post_worker_init(worker):
+    memory = process_memory()
+    if memory:
+        worker.log.info('worker %s booted: %s', worker.pid, _format(memory))
+
+
+def _format(memory):
+    return ', '.join(f'{kind.upper()} {value / 2 ** 20:.1f} MiB' for kind, value in memory.items())
@@ -0,0 +1,197 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from flask import Response, g, request
+
+# Callback instrumentation. With DASH_METRICS=1 every /_dash-update-component request is timed
+# (wall and CPU) and sized (request and response bytes) per callback output, into fixed-bucket
+# histograms, exposed as Prometheus text at /metrics and as JSON at /debug/callbacks. /metrics also
+# reports the serving process's unique, proportional and resident memory (see process_memory).
+# Unset, install() registers nothing and requests take the normal path.
+ENABLED = os.environ.get('DASH_METRICS', '').lower() in ('1', 'true', 'yes', 'on')
+
+DISPATCH_PATH = '/_dash-update-component'
+# any output that is not a registered callback is counted under this label, so clients can't grow the table
+OTHER = 'other'
+
+# bucket upper bounds; +Inf is implicit
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+SERIES = {
+    # name: (bucket bounds, help)
+    'wall_seconds': (SECONDS_BUCKETS, 'Wall time spent serving a callback request.'),
+    'cpu_seconds': (SECONDS_BUCKETS, 'CPU time of the serving thread for a callback request.'),
+    'request_bytes': (BYTES_BUCKETS, 'Size of the callback request body.'),
+    'response_bytes': (BYTES_BUCKETS, 'Size of the callback response body.'),
+}
+
+
+class Histogram:
+    """Counts per fixed bucket plus sum and max; memory stays the same however many samples arrive."""
+
+    __slots__ = ('bounds', 'counts', 'total', 'max')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th sample (max for the overflow bucket)."""
+        rank, seen = q * self.count, 0
+        for bound, n in zip(self.bounds + (self.max,), self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min(bound, self.max)
+        return 0.0
+
+
+class CallbackStats:
+    __slots__ = ('calls', 'errors', 'series')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.series = {name: Histogram(bounds) for name, (bounds, _) in SERIES.items()}
+
+
+class Registry:
+    def __init__(self, known_outputs):
+        # a live mapping: Dash merges @callback registrations into app.callback_map on the first request
+        self.known_outputs = known_outputs
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def record(self, output, status, samples):
+        key = output if output in self.known_outputs else OTHER
+        with self.lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = CallbackStats()
+            stats.calls += 1
+            stats.errors += status >= 500
+            for name, value in samples.items():
+                stats.series[name].observe(value)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                output: dict(
+                    calls=s.calls,
+                    errors=s.errors,
+                    **{name: dict(count=h.count, sum=h.total, max=h.max, p50=h.quantile(0.5), p95=h.quantile(0.95))
+                       for name, h in s.series.items()}
+                )
+                for output, s in self.stats.items()
+            }
+
+    def prometheus(self):
+        lines = []
+        with self.lock:
+            items = sorted(self.stats.items())
+            lines += ['# HELP dash_callback_calls_total Callback requests served.',
+                      '# TYPE dash_callback_calls_total counter']
+            lines += [f'dash_callback_calls_total{{output="{_label(o)}"}} {s.calls}' for o, s in items]
+            lines += ['# HELP dash_callback_errors_total Callback requests answered with a 5xx status.',
+                      '# TYPE dash_callback_errors_total counter']
+            lines += [f'dash_callback_errors_total{{output="{_label(o)}"}} {s.errors}' for o, s in items]
+            for name, (bounds, help_text) in SERIES.items():
+                metric = f'dash_callback_{name}'
+                lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} histogram']
+                for output, s in items:
+                    h, label = s.series[name], _label(output)
+                    cumulative = 0
+                    for bound, n in zip(bounds + ('+Inf',), h.counts):
+                        cumulative += n
+                        lines.append(f'{metric}_bucket{{output="{label}",le="{bound}"}} {cumulative}')
+                    lines.append(f'{metric}_sum{{output="{label}"}} {h.total}')
+                    lines.append(f'{metric}_count{{output="{label}"}} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+
+def process_memory(pid='self'):
+    """Memory of a process in bytes, from /proc/<pid>/smaps_rollup (Linux; {} elsewhere).
+
+    uss: pages only this process maps, what it would give back on exit. With gunicorn --preload this is
+         the per-worker cost; pages still shared with the master and the other workers are not in it.
+    pss: rss with every shared page divided among the processes sharing it; summed over the workers and
+         the master it is the server's real footprint.
+    """
+    fields = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if value.strip().endswith('kB'):
+                    fields[key] = int(value.split()[0]) * 1024
+    except OSError:
+        return {}
+    return dict(uss=fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+                pss=fields.get('Pss', 0), rss=fields.get('Rss', 0))
+
+
+def memory_prometheus():
+    memory = process_memory()
+    if not memory:
+        return ''
+    lines = ['# HELP dash_process_memory_bytes Memory of the serving process (uss: unique to it, pss: '
+             'proportional share, rss: resident).', '# TYPE dash_process_memory_bytes gauge']
+    lines += [f'dash_process_memory_bytes{{kind="{kind}",pid="{os.getpid()}"}} {value}'
+              for kind, value in memory.items()]
+    return '\n'.join(lines) + '\n'
+
+
+def _label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def install(app):
+    """Hook the callback instrumentation and its two routes into a Dash app, if DASH_METRICS is set."""
+    if not ENABLED:
+        return None
+    registry = Registry(app.callback_map)
+    server = app.server
+
+    @server.before_request
+    def _start_timer():
+        if request.path.endswith(DISPATCH_PATH):
+            g.callback_timer = (time.perf_counter(), time.thread_time())
+
+    @server.after_request
+    def _record(response):
+        timer = g.pop('callback_timer', None)
+        if timer is not None:
+            wall, cpu = time.perf_counter() - timer[0], time.thread_time() - timer[1]
+            body = request.get_json(silent=True) or {}
+            registry.record(body.get('output', OTHER), response.status_code, {
+                'wall_seconds': wall,
+                'cpu_seconds': cpu,
+                'request_bytes': request.content_length or 0,
+                'response_bytes': response.calculate_content_length() or 0,
+            })
+        return response
+
+    @server.route('/metrics')
+    def _metrics():
+        return Response(registry.prometheus() + memory_prometheus(), mimetype='text/plain; version=0.0.4')
+
+    @server.route('/debug/callbacks')
+    def _debug_callbacks():
+        stats = sorted(registry.snapshot().items(), key=lambda item: -item[1]['wall_seconds']['sum'])
+        return Response(json.dumps(dict(stats), indent=1), mimetype='application/json')
+
+    return registry
@@ -0,0 +1,171 @@
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import abort, g, request, send_from_directory
+
+# On-demand profiles of single callback requests. With DASH_PROFILING=1 a /_dash-update-component
+# request carrying an `X-Dash-Profile` header is profiled; DASH_PROFILING=all profiles every one.
+#   X-Dash-Profile: cprofile  (or any other value) -> deterministic cProfile, saved as pstats (.prof)
+#   X-Dash-Profile: sample                          -> statistical stack sampling, saved as collapsed
+#                                                      stacks (.collapsed) for flamegraph.pl / speedscope
+# Captures go to a bounded ring buffer on disk, listed at /debug/profiles and downloaded from
+# /debug/profiles/<name>. Unset, install() registers nothing.
+MODE = os.environ.get('DASH_PROFILING', '').lower()
+ENABLED = MODE in ('1', 'true', 'yes', 'on', 'all')
+PROFILE_ALL = MODE == 'all'
+
+PROFILE_DIR = os.environ.get('DASH_PROFILE_DIR', './profiles')
+PROFILE_KEEP = int(os.environ.get('DASH_PROFILE_KEEP', 50))
+SAMPLE_INTERVAL = float(os.environ.get('DASH_PROFILE_INTERVAL', 0.001))
+
+DISPATCH_PATH = '/_dash-update-component'
+HEADER = 'X-Dash-Profile'
+EXTENSIONS = {'cprofile': '.prof', 'sample': '.collapsed'}
+
+
+class StackSampler(threading.Thread):
+    """Samples one thread's Python stack every `interval` seconds into collapsed-stack counts."""
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self.done.set()
+        self.join()
+
+    def collapsed(self):
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """A directory holding at most `keep` captures; the oldest are deleted as new ones arrive."""
+
+    def __init__(self, directory=PROFILE_DIR, keep=PROFILE_KEEP):
+        self.directory = os.path.abspath(directory)
+        self.keep = keep
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _name(self, output, kind):
+        # time first, so names sort oldest-first; pid keeps workers sharing the directory apart
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', output).strip('._')[:80] or 'callback'
+        return f'{time.time_ns()}-{os.getpid()}-{slug}{EXTENSIONS[kind]}'
+
+    def save(self, output, kind, capture, wall):
+        name = self._name(output, kind)
+        path = os.path.join(self.directory, name)
+        if kind == 'cprofile':
+            capture.dump_stats(path)
+        else:
+            with open(path, 'w') as f:
+                f.write(capture.collapsed())
+        with open(path + '.json', 'w') as f:
+            json.dump({'output': output, 'kind': kind, 'wall_ms': round(wall * 1e3, 3)}, f)
+        with self.lock:
+            for old in self.names()[:-self.keep]:
+                for stale in (old, old + '.json'):
+                    try:
+                        os.remove(os.path.join(self.directory, stale))
+                    except FileNotFoundError:
+                        pass  # another worker got there first
+        return name
+
+    def names(self):
+        return sorted(n for n in os.listdir(self.directory) if n.endswith(tuple(EXTENSIONS.values())))
+
+    def listing(self):
+        entries = []
+        for name in reversed(self.names()):
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path + '.json') as f:
+                    meta = json.load(f)
+                size = os.path.getsize(path)
+            except (FileNotFoundError, ValueError):
+                continue  # evicted or half-written
+            entries.append(dict(meta, name=name, bytes=size, created=int(name.split('-', 1)[0]) / 1e9,
+                                url=f'/debug/profiles/{name}'))
+        return entries
+
+
+def _start(kind):
+    if kind == 'sample':
+        sampler = StackSampler(threading.get_ident())
+        sampler.start()
+        return sampler
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return None  # another profiler already owns this interpreter
+    return profiler
+
+
+def _stop(capture):
+    if isinstance(capture, StackSampler):
+        capture.stop()
+    else:
+        capture.disable()
+
+
+def install(app):
+    """Hook request profiling and the /debug/profiles routes into a Dash app, if DASH_PROFILING is set."""
+    if not ENABLED:
+        return None
+    store = ProfileStore()
+    server = app.server
+
+    @server.before_request
+    def _start_profile():
+        if not request.path.endswith(DISPATCH_PATH):
+            return
+        requested = request.headers.get(HEADER)
+        if requested or PROFILE_ALL:
+            kind = 'sample' if (requested or '').lower() == 'sample' else 'cprofile'
+            capture = _start(kind)
+            if capture is not None:
+                g.profile = (kind, capture, time.perf_counter())
+
+    @server.after_request
+    def _save_profile(response):
+        profile = g.pop('profile', None)
+        if profile is not None:
+            kind, capture, started = profile
+            wall = time.perf_counter() - started
+            _stop(capture)
+            body = request.get_json(silent=True) or {}
+            response.headers[HEADER + '-Name'] = store.save(body.get('output', 'unknown'), kind, capture, wall)
+        return response
+
+    @server.route('/debug/profiles')
+    def _list_profiles():
+        return {'profiles': store.listing()}
+
+    @server.route('/debug/profiles/<name>')
+    def _download_profile(name):
+        if name not in store.names():
+            abort(404)
+        return send_from_directory(store.directory, name, as_attachment=True)
+
+    return store
@@ -0,0 +1,116 @@
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Shared catalog helpers used by several tabs
+# NETFLIX_DATA points every tab at another catalog with the same columns (e.g. a synthetic one, see read_catalog)
+DATA_PATH = os.environ.get('NETFLIX_DATA', './data/netflix_titles.csv')
+
+# ---------- Language tagging ----------
+# A title counts for a language when any keyword appears (case-insensitively) in its
+# genres or description. Each language is one bit of `language_mask`.
+LANGUAGE_KEYWORDS = {
+    'Hindi': ['Bollywood', 'Indian'],
+    'Japanese': ['Anime', 'Japanese'],
+    'Korean': ['Korean', 'K-drama'],
+    'Spanish': ['Spanish', 'Español', 'Mexico', 'Spanish-language'],
+    'French': ['French', 'Paris'],
+    'English': ['British', 'American', 'English']
+}
+LANGUAGES = list(LANGUAGE_KEYWORDS)
+LANGUAGE_BITS = {lang: 1 << i for i, lang in enumerate(LANGUAGES)}
+
+
+def _keyword_masks():
+    # Longest keyword first, so at any position the regex captures the longest hit;
+    # every shorter keyword starting there is a prefix of it and contributes its bit too.
+    masks = {}
+    for lang, keywords in LANGUAGE_KEYWORDS.items():
+        for kw in keywords:
+            masks[kw.lower()] = masks.get(kw.lower(), 0) | LANGUAGE_BITS[lang]
+    for kw in masks:
+        for other, bits in masks.items():
+            if kw.startswith(other):
+                masks[kw] |= bits
+    return dict(sorted(masks.items(), key=lambda item: -len(item[0])))
+
+
+KEYWORD_MASKS = _keyword_masks()
+# zero-width lookahead so overlapping keywords are all seen in a single scan; matching
+# runs on lower-cased text since a case-insensitive regex is ~4x slower
+LANGUAGE_PATTERN = re.compile('(?=(' + '|'.join(map(re.escape, KEYWORD_MASKS)) + '))')
+
+
+def language_mask(*columns):
+    """Bitmask of LANGUAGE_BITS per row, from one regex pass over the joined text columns."""
+    text = columns[0].fillna('').astype(str)
+    for col in columns[1:]:
+        text = text + '\n' + col.fillna('').astype(str)
+    text = text.str.lower()
+
+    # one blob, one scan; hit offsets map back to rows through the cumulative lengths
+    ends = np.cumsum(text.str.len().to_numpy() + 1)
+    starts, bits = [], []
+    for match in LANGUAGE_PATTERN.finditer('\x00'.join(text)):
+        starts.append(match.start())
+        bits.append(KEYWORD_MASKS[match.group(1)])
+
+    mask = np.zeros(len(text), dtype=np.uint8)
+    np.bitwise_or.at(mask, np.searchsorted(ends, starts, side='right'), np.array(bits, dtype=np.uint8))
+    return mask
+
+
+def language_counts(mask):
+    """Titles per language, most common first, as a Language/Count frame."""
+    counts = [(lang, int(np.count_nonzero(mask & bit))) for lang, bit in LANGUAGE_BITS.items()]
+    return pd.DataFrame(counts, columns=['Language', 'Count']).sort_values(by='Count', ascending=False)
+
+
+# ---------- Rating categories ----------
+RATING_GROUPS = {
+    'Kids': ['TV-Y', 'TV-Y7', 'TV-G', 'G', 'TV-Y7-FV'],
+    'Teens': ['TV-PG', 'PG', 'PG-13', 'TV-14'],
+    'Adults': ['TV-MA', 'R', 'NC-17', 'NR', 'UR']
+}
+CATEGORIES = list(RATING_GROUPS)
+RATING_CATEGORY = {rating: i for i, ratings in enumerate(RATING_GROUPS.values()) for rating in ratings}
+
+
+def rating_category(ratings):
+    """Categorical of CATEGORIES per rating (NaN when the rating is not grouped).
+
+    Only the distinct ratings go through the dict; rows get their category by code lookup.
+    """
+    codes, uniques = pd.factorize(ratings)
+    lookup = np.array([RATING_CATEGORY.get(r, -1) for r in uniques] + [-1], dtype=np.int8)
+    return pd.Categorical.from_codes(lookup[codes], CATEGORIES)
+
+
+# ---------- Shared frame ----------
+def read_catalog(path=DATA_PATH):
+    """The raw catalog: CSV, or a pickled DataFrame (.pkl) such as the large synthetic benchmark catalogs."""
+    return pd.read_pickle(path) if path.endswith('.pkl') else pd.read_csv(path)
+
+
+@lru_cache(maxsize=1)
+def load_titles():
+    """The catalog with the derived `language_mask` and `category` columns, read once per process.
+
+    Callers that add columns of their own should work on a copy.
+    """
+    df = read_catalog()
+    df['language_mask'] = language_mask(df['listed_in'], df['description'])
+    df['category'] = rating_category(df['rating'])
+    return df
+
+
+def split_values(series, sep=','):
+    """(row positions, value codes, labels) for a delimited column, values stripped and blanks dropped."""
+    values = series.fillna('').str.split(sep).explode().str.strip()
+    values = values[values != '']
+    codes, labels = pd.factorize(values, sort=True)
+    return series.index.get_indexer(values.index), codes, labels
+
@@ -5,8 +5,10 @@ import plotly.graph_objects as go
 from datetime import datetime
 import dash
 
+from tabs.catalog import read_catalog
+
 # Load and preprocess data
-df = pd.read_csv('./data/netflix_titles.csv')
+df = read_catalog()
 
 # Clean data
 df['country'] = df['country'].fillna('Unknown')
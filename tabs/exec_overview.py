@@ -1,286 +1,380 @@
-from dash import html, dcc, callback, Output, Input
+from dash import html, dcc, callback, Output, Input, State
+from functools import lru_cache
+from collections import namedtuple
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import numpy as np
 
-# Loadind and Processing data
-df = pd.read_csv('./data/netflix_titles.csv')
-
-# Type data
-type_counts = df['type'].value_counts().reset_index()
-type_counts.columns = ['Type', 'Count']
+from tabs.catalog import CATEGORIES, LANGUAGE_BITS, load_titles, split_values
+from tabs.theme import freeze, template_for, theme_patch, themed_specs
 
-# year data
-year_counts = df['release_year'].value_counts().sort_index().reset_index()
-year_counts.columns = ['Release Year', 'Count']
+# Loadind and Processing data
+df = load_titles().copy()
 
 df['date_added'] = pd.to_datetime(df['date_added'].str.strip(), format='%B %d, %Y', errors='coerce')
 df['year_added'] = df['date_added'].dt.year
-content_trends = df.groupby(['year_added', 'type']).size().reset_index(name='Count')
-content_trends = content_trends[
-    (content_trends['year_added'] > 2010) &
-    (content_trends['year_added'] < content_trends['year_added'].max())
-]
-
-
-# country data
-country_list = df["country"].str.split(",").explode().str.strip()  # parsing multiple countries and adding them to the count
-country_counts = country_list.value_counts().head(20)  # top 20 countries
-country_normalized_counts = country_list.value_counts(normalize=True)
-shannon_index = -np.sum(country_normalized_counts * np.log2(country_normalized_counts))  # Shannon diversity index
-
-titles = df['title'].count()
-countries = country_list.nunique()
-start_value = year_counts['Count'].iloc[0]
-end_value = year_counts['Count'].iloc[-1]
-num_years = len(year_counts) - 1
-
-CAGR = ((end_value / start_value) ** (1 / num_years) - 1) * 100
-
-# language data
-lang_keywords = {
-    'Hindi': ['Bollywood', 'Indian'],
-    'Japanese': ['Anime', 'Japanese'],
-    'Korean': ['Korean', 'K-drama'],
-    'Spanish': ['Spanish', 'Español', 'Mexico', 'Spanish-language'],
-    'French': ['French', 'Paris'],
-    'English': ['British', 'American', 'English']
-}
-
-language_counts = {}
-for lang, keywords in lang_keywords.items():
-    count = df[df['listed_in'].str.contains('|'.join(keywords), case=False, na=False) |
-               df['description'].str.contains('|'.join(keywords), case=False, na=False)].shape[0]
-    language_counts[lang] = count
-
-# Convert to DataFrame
-lang_df = pd.DataFrame(list(language_counts.items()), columns=['Language', 'Count']).sort_values(by='Count', ascending=False)
-
-# ---- PIE CHART ----
-fig_pie = px.pie(
-    type_counts,
-    names='Type',
-    values='Count',
-    color='Type',
-    color_discrete_sequence=['#E50914', '#B20710'],  # Netflix reds
-    hole=0.45,
+
+# ---- AGGREGATE CUBE ----
+# Title counts pre-aggregated over type x release_year x year_added x category x language,
+# once for every country a title lists and once more under ALL_COUNTRIES. Genre and
+# country mentions get their own slices keyed the same way. Filters only ever select
+# cube cells, never rows.
+type_codes, TYPES = pd.factorize(df['type'], sort=True)
+year_codes, YEARS = pd.factorize(df['release_year'], sort=True)
+added_codes, ADDED_YEARS = pd.factorize(df['year_added'], sort=True)
+category_codes = df['category'].cat.codes.to_numpy()
+TYPES, YEARS, ADDED_YEARS = TYPES.to_numpy(), YEARS.to_numpy(), ADDED_YEARS.to_numpy().astype(int)
+
+country_rows, country_codes, COUNTRIES = split_values(df['country'])
+genre_rows, genre_codes, GENRES = split_values(df['listed_in'])
+COUNTRIES, GENRES = COUNTRIES.to_numpy(), GENRES.to_numpy()
+ALL_COUNTRIES = len(COUNTRIES)
+
+# every title is filed under ALL_COUNTRIES plus each country it lists
+key_rows = np.concatenate([np.arange(len(df)), country_rows])
+country_keys = np.concatenate([np.full(len(df), ALL_COUNTRIES), country_codes])
+key_order = np.argsort(key_rows, kind='stable')
+key_ptr = np.concatenate([[0], np.cumsum(np.bincount(key_rows, minlength=len(df)))])
+
+
+def by_country_key(rows, values):
+    """Repeat each (row, value) mention once per country key of its row."""
+    lengths = key_ptr[rows + 1] - key_ptr[rows]
+    positions = np.arange(lengths.sum()) + np.repeat(key_ptr[rows] - np.cumsum(lengths) + lengths, lengths)
+    return np.repeat(rows, lengths), country_keys[key_order[positions]], np.repeat(values, lengths)
+
+
+def build_cube(**columns):
+    """COO cube: the distinct combinations of integer code columns (-1 allowed) and their counts."""
+    names, codes = list(columns), [np.asarray(c) + 1 for c in columns.values()]
+    keys, counts = np.unique(np.ravel_multi_index(codes, [c.max() + 1 for c in codes]), return_counts=True)
+    cells = np.unravel_index(keys, [c.max() + 1 for c in codes])
+    cube = {name: (cell - 1).astype(np.int32) for name, cell in zip(names, cells)}
+    cube['count'] = counts
+    return cube
+
+
+TITLE_CUBE = build_cube(
+    country=country_keys, type=type_codes[key_rows], year=year_codes[key_rows], added=added_codes[key_rows],
+    category=category_codes[key_rows], language=df['language_mask'].to_numpy()[key_rows]
 )
-fig_pie.update_layout(
+rows, keys, genres_of = by_country_key(genre_rows, genre_codes)
+GENRE_CUBE = build_cube(country=keys, type=type_codes[rows], year=year_codes[rows], genre=genres_of)
+rows, keys, countries_of = by_country_key(country_rows, country_codes)
+COUNTRY_CUBE = build_cube(country=keys, type=type_codes[rows], year=year_codes[rows], label=countries_of)
+del rows, keys, genres_of, countries_of
+
+# the latest year_added is partial, so the volume line stops the year before
+VOLUME_YEARS = (ADDED_YEARS > 2010) & (ADDED_YEARS < ADDED_YEARS.max())
+
+Overview = namedtuple('Overview', [
+    'type_counts', 'year_counts', 'category_counts', 'language_counts', 'added_counts',
+    'genre_counts', 'country_counts', 'genre_by_year', 'country_by_year'
+])
+
+
+def select(cube, type_, year_range, country):
+    keep = cube['country'] == country
+    if type_ >= 0:
+        keep &= cube['type'] == type_
+    keep &= (cube['year'] >= year_range[0]) & (cube['year'] <= year_range[1])
+    return {name: col[keep] for name, col in cube.items()}
+
+
+def counts_by(cells, cube, size):
+    return np.bincount(cells, weights=cube['count'], minlength=size).astype(np.int64)
+
+
+def per_year(cube, label, n_labels):
+    return counts_by(cube['year'] * n_labels + cube[label], cube, len(YEARS) * n_labels).reshape(len(YEARS), n_labels)
+
+
+@lru_cache(maxsize=256)
+def overview(type_='all', year_range=None, country='all'):
+    """Every Overview aggregate for one filter combination, read off the cubes."""
+    type_code = TYPES.tolist().index(type_) if type_ in TYPES else -1
+    country_code = COUNTRIES.tolist().index(country) if country in COUNTRIES else ALL_COUNTRIES
+    lo, hi = year_range or (YEARS[0], YEARS[-1])
+    span = (np.searchsorted(YEARS, lo), np.searchsorted(YEARS, hi, side='right') - 1)
+
+    titles = select(TITLE_CUBE, type_code, span, country_code)
+    graded = {name: col[titles['category'] >= 0] for name, col in titles.items()}
+    added = {name: col[titles['added'] >= 0] for name, col in titles.items()}
+    genre_by_year = per_year(select(GENRE_CUBE, type_code, span, country_code), 'genre', len(GENRES))
+    country_by_year = per_year(select(COUNTRY_CUBE, type_code, span, country_code), 'label', len(COUNTRIES))
+    return Overview(
+        type_counts=counts_by(titles['type'], titles, len(TYPES)),
+        year_counts=counts_by(titles['year'], titles, len(YEARS)),
+        category_counts=counts_by(graded['category'] * len(TYPES) + graded['type'], graded,
+                                  len(CATEGORIES) * len(TYPES)).reshape(len(CATEGORIES), len(TYPES)),
+        language_counts={lang: int(titles['count'][(titles['language'] & bit) > 0].sum())
+                         for lang, bit in LANGUAGE_BITS.items()},
+        added_counts=counts_by(added['added'] * len(TYPES) + added['type'], added,
+                               len(ADDED_YEARS) * len(TYPES)).reshape(len(ADDED_YEARS), len(TYPES)),
+        genre_counts=genre_by_year.sum(axis=0),
+        country_counts=country_by_year.sum(axis=0),
+        genre_by_year=genre_by_year,
+        country_by_year=country_by_year
+    )
+
+
+def shannon(counts, axis=None):
+    shares = counts / np.maximum(counts.sum(axis=axis, keepdims=True), 1)
+    # clamped so no titles (or a single country) reads 0.00 rather than -0.00
+    return np.maximum(-(shares * np.log2(np.where(shares > 0, shares, 1))).sum(axis=axis), 0.0)
+
+
+def kpis(ov):
+    """Headline KPI values and the per-year series behind their sparklines."""
+    active = ov.year_counts > 0
+    counts = ov.year_counts[active]
+    cagr = ((counts[-1] / counts[0]) ** (1 / (len(counts) - 1)) - 1) * 100 if len(counts) > 1 else 0.0
+    yearly = pd.DataFrame({
+        'release_year': YEARS[active],
+        'Count': counts,
+        'Genre Count': np.count_nonzero(ov.genre_by_year[active], axis=1),
+        'country': np.count_nonzero(ov.country_by_year[active], axis=1),
+        'Diversity': shannon(ov.country_by_year[active], axis=1)
+    })
+    return {
+        'titles': int(counts.sum()),
+        'cagr': cagr,
+        'countries': int(np.count_nonzero(ov.country_counts)),
+        'genres': int(np.count_nonzero(ov.genre_counts)),
+        'shannon': shannon(ov.country_counts),
+        'yearly': yearly
+    }
+
+
+# ---- FIGURES ----
+# Layouts depend only on the theme, so each is built, validated and frozen once per
+# theme and shared by every request; a render only fills plain trace dicts with counts.
+def _theme_layout(theme):
+    """The theme's template; every chart here hides the grid on both axes."""
+    return dict(template=template_for(theme), xaxis=dict(showgrid=False), yaxis=dict(showgrid=False))
+
+
+def themed_layouts(**layout):
+    return {theme: spec['layout'] for theme, spec in themed_specs(go.Figure(layout=layout), _theme_layout).items()}
+
+
+PIE_LAYOUT = themed_layouts(
     title=dict(
         text='Movies vs TV Shows',
-        font=dict(size=18, color='white'),
+        font=dict(size=18),
         x=0.5,
         xanchor='center'
     ),
-    paper_bgcolor='rgba(0,0,0,0)',
-    plot_bgcolor='rgba(0,0,0,0)',
-    font=dict(color='white'),
-)
-fig_pie.update_traces(
-    textinfo='percent+label',
-    textfont_size=14,
-    marker=dict(line=dict(color='#121212', width=2)),
-    hovertemplate='<b>%{label}</b><br>%{value} Titles<br>%{percent}',
 )
 
-# ---- BAR CHART (Years) ----
-fig_bar = px.bar(
-    year_counts.tail(30),  # Show last 30 years for clarity
-    x='Release Year',
-    y='Count',
-    text='Count',
-    color='Count',
-    color_continuous_scale=['#B20710', '#E50914']
-)
-fig_bar.update_layout(
+YEAR_BAR_LAYOUT = themed_layouts(
     title=dict(
         text='Content Releases Over the Years',
-        font=dict(size=18, color='white'),
+        font=dict(size=18),
         x=0.5
     ),
-    paper_bgcolor='rgba(0,0,0,0)',
-    plot_bgcolor='rgba(0,0,0,0)',
-    font=dict(color='white'),
-    xaxis=dict(showgrid=False, tickfont=dict(size=11)),
-    yaxis=dict(showgrid=False, tickfont=dict(size=11)),
-    coloraxis_showscale=False,
-)
-fig_bar.update_traces(
-    textposition='outside',
-    marker_line_color='#121212',
-    marker_line_width=1.2,
-    hovertemplate='<b>%{x}</b><br>%{y} Titles'
+    xaxis=dict(title='Release Year', showgrid=False, tickfont=dict(size=11)),
+    yaxis=dict(title='Count', showgrid=False, tickfont=dict(size=11)),
+    coloraxis=dict(colorscale=['#B20710', '#E50914'], showscale=False),
 )
 
-# ---- CATEGORY HISTOGRAM ----
-rating_groups = {
-    'Kids': ['TV-Y', 'TV-Y7', 'TV-G', 'G', 'TV-Y7-FV'],
-    'Teens': ['TV-PG', 'PG', 'PG-13', 'TV-14'],
-    'Adults': ['TV-MA', 'R', 'NC-17', 'NR', 'UR']
-}
-def cat(x):
-    for k, v in rating_groups.items():
-        if x['rating'] in v:
-            return k
-df['category'] = df.apply(lambda x: cat(x), axis=1)
-
-fig_hist = px.histogram(
-    df,
-    x='category',
-    color='type',
+CATEGORY_LAYOUT = themed_layouts(
     barmode='group',
-    color_discrete_sequence=['#E50914', "#B0262D"]
-)
-fig_hist.update_layout(
     title=dict(
         text='Rates of Category by Type',
-        font=dict(size=18, color='white'),
+        font=dict(size=18),
         x=0.5
     ),
     xaxis=dict(
         title='Category',
         tickangle=45,
-        tickfont=dict(size=11, color='white')
+        tickfont=dict(size=11)
     ),
     yaxis=dict(
         title='Count',
-        tickfont=dict(size=11, color='white')
+        tickfont=dict(size=11)
     ),
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font=dict(color='white'),
     legend=dict(title='Type')
 )
 
-# ---- Top Countries ----
-fig_country_bar = px.bar(
-    country_counts,
-    x=country_counts.values[::-1],
-    y=country_counts.index[::-1],
-    color='count',
-    color_continuous_scale=['#B20710', '#E50914']
-)
-fig_country_bar.update_layout(
+COUNTRY_BAR_LAYOUT = themed_layouts(
     title=dict(
         text='Top 20 countries ',
-        font=dict(size=18, color='white'),
+        font=dict(size=18),
         x=0.5
     ),
+    coloraxis=dict(colorscale=['#B20710', '#E50914'], colorbar=dict(title='count')),
     xaxis=dict(
         title='Country',
         tickangle=0,
-        tickfont=dict(size=11, color='white'),
+        tickfont=dict(size=11),
         showgrid=False
     ),
     yaxis=dict(
         title='Count',
-        tickfont=dict(size=11, color='white'),
+        tickfont=dict(size=11),
         showgrid=False
     ),
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font=dict(color='white'),
 )
 
-# ---- Language Bar Graph ----
-fig_lang_bar = px.bar(
-    lang_df,
-    x=lang_df['Language'],
-    y=lang_df['Count'],
-    color='Count',
-     color_continuous_scale=['#B20710', "#EB1D27"]
-)
-fig_lang_bar.update_layout(
+LANGUAGE_BAR_LAYOUT = themed_layouts(
     title=dict(
         text='Language Based Content Division',
-        font=dict(size=18, color='white'),
+        font=dict(size=18),
         x=0.5
     ),
+    coloraxis=dict(colorscale=['#B20710', "#EB1D27"], colorbar=dict(title='Count')),
     xaxis=dict(
         title='Language',
         tickangle=0,
-        tickfont=dict(size=11, color='white'),
+        tickfont=dict(size=11),
     ),
     yaxis=dict(
         title='Count',
-        tickfont=dict(size=11, color='white'),
+        tickfont=dict(size=11),
         showgrid=False
     ),
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font=dict(color='white'),
 )
 
-# --- Content Volume Trends Over Time ---
-
-fig_line = px.line(
-    content_trends,
-    x='year_added',
-    y='Count',
-    color='type',
-    title=' Content Volume Added to Netflix (2011-Present)',
-    markers=True,
-    color_discrete_map={'Movie': '#E50914', 'TV Show': '#B00000'}
-)
-fig_line.update_layout(
+VOLUME_LINE_LAYOUT = themed_layouts(
     title=dict(
         text='Content Volume over the year',
-        font=dict(size=18, color='white'),
+        font=dict(size=18),
         x=0.5
     ),
     xaxis=dict(
         title='Volume',
         tickangle=0,
-        tickfont=dict(size=11, color='white'),
+        tickfont=dict(size=11),
         showgrid=False
     ),
     yaxis=dict(
         title='Count',
-        tickfont=dict(size=11, color='white'),
+        tickfont=dict(size=11),
     ),
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font=dict(color='white'),
+    legend=dict(title='type')
 )
 
-# --- Genre Distribution & Popularity ---
-genre_df = df.copy()
-genre_df = genre_df.set_index('title')['listed_in'].str.split(', ', expand=True).stack()
-genre_df = genre_df.reset_index(level=1, drop=True).value_counts().reset_index()
-genre_df.columns = ['Genre', 'Count']
-genres = genre_df['Genre'].count()
-
-fig_genre_bar = px.bar(
-    genre_df.head(20),
-    x='Count',
-    y='Genre',
-    orientation='h',
-    title=' Top 20 Genres on Netflix',
-    color='Count',
-    color_continuous_scale='Reds'
-)
-fig_genre_bar.update_layout(
+GENRE_BAR_LAYOUT = themed_layouts(
     title=dict(
         text='Content Volume over the year',
-        font=dict(size=18, color='white'),
+        font=dict(size=18),
         x=0.5
     ),
+    coloraxis=dict(colorscale='Reds', colorbar=dict(title='Count')),
     xaxis=dict(
         title='Volume',
         tickangle=0,
-        tickfont=dict(size=11, color='white'),
+        tickfont=dict(size=11),
         showgrid=False
     ),
     yaxis=dict(
         title='Count',
-        tickfont=dict(size=11, color='white'),
+        tickfont=dict(size=11),
         autorange='reversed'
     ),
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font=dict(color='white'),
 )
 
+SPARKLINE_LAYOUT = freeze(go.Layout(
+    height=100, width=200,
+    margin=dict(l=0, r=0, t=0, b=0),
+    xaxis_visible=False, yaxis_visible=False,
+    showlegend=False,
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)'
+).to_plotly_json())
+
+
+def type_pie_figure(ov, theme):
+    nz = ov.type_counts > 0
+    return {'data': [dict(
+        type='pie',
+        labels=TYPES[nz],
+        values=ov.type_counts[nz],
+        hole=0.45,
+        textinfo='percent+label',
+        textfont=dict(size=14),
+        marker=dict(colors=np.array(['#E50914', '#B20710'])[np.flatnonzero(nz) % 2],  # Netflix reds
+                    line=dict(color='#121212', width=2)),
+        hovertemplate='<b>%{label}</b><br>%{value} Titles<br>%{percent}',
+    )], 'layout': PIE_LAYOUT[theme]}
+
+
+def year_bar_figure(ov, theme):
+    nz = np.flatnonzero(ov.year_counts)[-30:]  # Show last 30 years for clarity
+    return {'data': [dict(
+        type='bar',
+        x=YEARS[nz],
+        y=ov.year_counts[nz],
+        text=ov.year_counts[nz],
+        textposition='outside',
+        marker=dict(color=ov.year_counts[nz], coloraxis='coloraxis', line=dict(color='#121212', width=1.2)),
+        hovertemplate='<b>%{x}</b><br>%{y} Titles'
+    )], 'layout': YEAR_BAR_LAYOUT[theme]}
+
+
+def category_figure(ov, theme):
+    colors = ['#E50914', '#B0262D']
+    return {'data': [
+        dict(type='bar', x=CATEGORIES, y=ov.category_counts[:, t], name=name, marker=dict(color=colors[t % 2]))
+        for t, name in enumerate(TYPES)
+    ], 'layout': CATEGORY_LAYOUT[theme]}
+
+
+def country_bar_figure(ov, theme):
+    top = np.argsort(-ov.country_counts, kind='stable')[:20]  # top 20 countries
+    top = top[ov.country_counts[top] > 0][::-1]
+    return {'data': [dict(
+        type='bar',
+        x=ov.country_counts[top],
+        y=COUNTRIES[top],
+        orientation='h',
+        marker=dict(color=ov.country_counts[top], coloraxis='coloraxis')
+    )], 'layout': COUNTRY_BAR_LAYOUT[theme]}
+
+
+def language_bar_figure(ov, theme):
+    lang_df = pd.Series(ov.language_counts).sort_values(ascending=False)
+    return {'data': [dict(
+        type='bar',
+        x=lang_df.index,
+        y=lang_df.to_numpy(),
+        marker=dict(color=lang_df.to_numpy(), coloraxis='coloraxis')
+    )], 'layout': LANGUAGE_BAR_LAYOUT[theme]}
+
+
+def volume_line_figure(ov, theme):
+    colors = {'Movie': '#E50914', 'TV Show': '#B00000'}
+    return {'data': [
+        dict(type='scatter', x=ADDED_YEARS[VOLUME_YEARS], y=ov.added_counts[VOLUME_YEARS, t], name=name,
+             mode='lines+markers', line=dict(color=colors.get(name, '#E50914')))
+        for t, name in enumerate(TYPES) if ov.added_counts[VOLUME_YEARS, t].any()
+    ], 'layout': VOLUME_LINE_LAYOUT[theme]}
+
+
+def genre_bar_figure(ov, theme):
+    top = np.argsort(-ov.genre_counts, kind='stable')[:20]
+    top = top[ov.genre_counts[top] > 0]
+    return {'data': [dict(
+        type='bar',
+        x=ov.genre_counts[top],
+        y=GENRES[top],
+        orientation='h',
+        marker=dict(color=ov.genre_counts[top], coloraxis='coloraxis')
+    )], 'layout': GENRE_BAR_LAYOUT[theme]}
+
+
+def sparkline_figure(yearly, y, color, fill=True):
+    return {'data': [dict(
+        type='scatter', x=yearly['release_year'].to_numpy(), y=yearly[y].to_numpy(), mode='lines',
+        fill='tozeroy' if fill else None, line=dict(color=color)
+    )], 'layout': SPARKLINE_LAYOUT}
+
+
+FILTER_TYPES = [{'label': 'All Types', 'value': 'all'}] + [{'label': t, 'value': t} for t in TYPES]
+FILTER_COUNTRIES = [{'label': 'All Countries', 'value': 'all'}] + [{'label': c, 'value': c} for c in COUNTRIES]
+YEAR_MIN, YEAR_MAX = int(YEARS[0]), int(YEARS[-1])
+
 # ---- LAYOUT ----
 layout = html.Div(
     children=[
@@ -311,6 +405,54 @@ layout = html.Div(
                 'color': 'var(--font-color)'
             }
         ),
+
+        # --- Filters ---
+        html.Div([
+            dcc.Dropdown(
+                id='exec-type',
+                options=FILTER_TYPES,
+                value='all',
+                clearable=False,
+                placeholder='Type',
+                className='theme-dropdown',
+                style={
+                    'backgroundColor': 'var(--dropdown-bg)',
+                    'color': 'var(--dropdown-text)',
+                }
+            ),
+            dcc.Dropdown(
+                id='exec-country',
+                options=FILTER_COUNTRIES,
+                value='all',
+                clearable=False,
+                placeholder='Country',
+                className='theme-dropdown',
+                style={
+                    'backgroundColor': 'var(--dropdown-bg)',
+                    'color': 'var(--dropdown-text)',
+                }
+            ),
+            html.Div([
+                html.Label('Release Year Range:',
+                           style={'color': 'var(--muted-text)', 'marginBottom': '8px', 'fontSize': '0.9rem'}),
+                dcc.RangeSlider(
+                    id='exec-year',
+                    min=YEAR_MIN,
+                    max=YEAR_MAX,
+                    value=[YEAR_MIN, YEAR_MAX],
+                    marks={y: str(y) for y in range(YEAR_MIN, YEAR_MAX + 1, 10)},
+                    tooltip={"placement": "bottom"},
+                    className='year-slider'
+                )
+            ], style={'gridColumn': '1 / -1', 'marginTop': '15px'}),
+        ], style={
+            'display': 'grid',
+            'gridTemplateColumns': '1fr 1fr',
+            'gap': '12px',
+            'width': '95%',
+            'margin': 'auto',
+            'marginBottom': '30px'
+        }),
         html.Div(
             [
                 html.Div(
@@ -331,7 +473,7 @@ layout = html.Div(
                                 # --- Titles ---
                                 html.Div(
                                     [
-                                        html.P(f'{titles}', style={
+                                        html.P(id='kpi-titles', style={
                                             'textAlign': 'center',
                                             'font-size': '2rem',
                                             'margin': '0'
@@ -341,17 +483,7 @@ layout = html.Div(
                                             'margin': '0 0 10px 0'
                                         }),
                                         dcc.Graph(
-                                            figure=px.area(
-                                                year_counts,
-                                                x='Release Year', y='Count',
-                                                height=100, width=200,
-                                                color_discrete_sequence=['#E50914']
-                                            ).update_layout(
-                                                margin=dict(l=0, r=0, t=0, b=0),
-                                                xaxis_visible=False, yaxis_visible=False,
-                                                paper_bgcolor='rgba(0,0,0,0)',
-                                                plot_bgcolor='rgba(0,0,0,0)'
-                                            ).update_traces(mode='lines', fill='tozeroy'),
+                                            id='kpi-titles-spark',
                                             config={'displayModeBar': False},
                                             style={'marginTop': '5px'}
                                         )
@@ -372,7 +504,7 @@ layout = html.Div(
                                 # --- CAGR ---
                                 html.Div(
                                     [
-                                        html.P(f'{CAGR:.2f}%', style={
+                                        html.P(id='kpi-cagr', style={
                                             'textAlign': 'center',
                                             'font-size': '2rem',
                                             'margin': '0'
@@ -382,17 +514,7 @@ layout = html.Div(
                                             'margin': '0 0 10px 0'
                                         }),
                                         dcc.Graph(
-                                            figure=px.area(
-                                                year_counts,
-                                                x='Release Year', y='Count',
-                                                height=100, width=200,
-                                                color_discrete_sequence=['#B20710']
-                                            ).update_layout(
-                                                margin=dict(l=0, r=0, t=0, b=0),
-                                                xaxis_visible=False, yaxis_visible=False,
-                                                paper_bgcolor='rgba(0,0,0,0)',
-                                                plot_bgcolor='rgba(0,0,0,0)'
-                                            ).update_traces(mode='lines', fill='tozeroy'),
+                                            id='kpi-cagr-spark',
                                             config={'displayModeBar': False},
                                             style={'marginTop': '5px'}
                                         )
@@ -413,7 +535,7 @@ layout = html.Div(
                                 # --- Countries ---
                                 html.Div(
                                     [
-                                        html.P(f'{countries}', style={
+                                        html.P(id='kpi-countries', style={
                                             'textAlign': 'center',
                                             'font-size': '2rem',
                                             'margin': '0'
@@ -423,17 +545,7 @@ layout = html.Div(
                                             'margin': '0 0 10px 0'
                                         }),
                                         dcc.Graph(
-                                            figure=px.line(
-                                                df.groupby('release_year')['country'].nunique().reset_index(),
-                                                x='release_year', y='country',
-                                                height=100, width=200,
-                                                color_discrete_sequence=['#E50914']
-                                            ).update_layout(
-                                                margin=dict(l=0, r=0, t=0, b=0),
-                                                xaxis_visible=False, yaxis_visible=False,
-                                                paper_bgcolor='rgba(0,0,0,0)',
-                                                plot_bgcolor='rgba(0,0,0,0)'
-                                            ),
+                                            id='kpi-countries-spark',
                                             config={'displayModeBar': False},
                                             style={'marginTop': '5px'}
                                         )
@@ -454,7 +566,7 @@ layout = html.Div(
                                 # --- Genres ---
                                 html.Div(
                                     [
-                                        html.P(f'{genres}', style={
+                                        html.P(id='kpi-genres', style={
                                             'textAlign': 'center',
                                             'font-size': '2rem',
                                             'margin': '0'
@@ -464,19 +576,7 @@ layout = html.Div(
                                             'margin': '0 0 10px 0'
                                         }),
                                         dcc.Graph(
-                                            figure=px.area(
-                                                df.groupby('release_year')['listed_in']
-                                                .apply(lambda x: x.str.split(',').explode().nunique())
-                                                .reset_index(name='Genre Count'),
-                                                x='release_year', y='Genre Count',
-                                                height=100, width=200,
-                                                color_discrete_sequence=['#E50914']
-                                            ).update_layout(
-                                                margin=dict(l=0, r=0, t=0, b=0),
-                                                xaxis_visible=False, yaxis_visible=False,
-                                                paper_bgcolor='rgba(0,0,0,0)',
-                                                plot_bgcolor='rgba(0,0,0,0)'
-                                            ).update_traces(mode='lines', fill='tozeroy'),
+                                            id='kpi-genres-spark',
                                             config={'displayModeBar': False},
                                             style={'marginTop': '5px'}
                                         )
@@ -497,7 +597,7 @@ layout = html.Div(
                                 # --- Shannon Diversity Index ---
                                 html.Div(
                                     [
-                                        html.P(f'{shannon_index:.2f}', style={
+                                        html.P(id='kpi-shannon', style={
                                             'textAlign': 'center',
                                             'font-size': '2rem',
                                             'margin': '0'
@@ -507,19 +607,7 @@ layout = html.Div(
                                             'margin': '0 0 10px 0'
                                         }),
                                         dcc.Graph(
-                                            figure=px.area(
-                                                df.groupby('release_year')['country']
-                                                .apply(lambda x: x.dropna().str.split(',').explode().nunique())
-                                                .reset_index(name='Diversity'),
-                                                x='release_year', y='Diversity',
-                                                height=100, width=200,
-                                                color_discrete_sequence=['#B0262D']
-                                            ).update_layout(
-                                                margin=dict(l=0, r=0, t=0, b=0),
-                                                xaxis_visible=False, yaxis_visible=False,
-                                                paper_bgcolor='rgba(0,0,0,0)',
-                                                plot_bgcolor='rgba(0,0,0,0)'
-                                            ).update_traces(mode='lines', fill='tozeroy'),
+                                            id='kpi-shannon-spark',
                                             config={'displayModeBar': False},
                                             style={'marginTop': '5px'}
                                         )
@@ -595,7 +683,7 @@ layout = html.Div(
         html.Div(
             [
                 html.Div(
-                    dcc.Graph(id='year-bar', figure=fig_bar, config={'displayModeBar': False}),
+                    dcc.Graph(id='year-bar', figure={}, config={'displayModeBar': False}),
                     className='chart-card',
                     style={
                         'flex': '1',
@@ -609,7 +697,7 @@ layout = html.Div(
                     }
                 ),
                 html.Div(
-                    dcc.Graph(id='type-pie', figure=fig_pie, config={'displayModeBar': False}),
+                    dcc.Graph(id='type-pie', figure={}, config={'displayModeBar': False}),
                     className='chart-card',
                     style={
                         'flex': '1',
@@ -623,7 +711,7 @@ layout = html.Div(
                     }
                 ),
                 html.Div(
-                    dcc.Graph(id='category-hist', figure=fig_hist, config={'displayModeBar': False}),
+                    dcc.Graph(id='category-hist', figure={}, config={'displayModeBar': False}),
                     className='chart-card',
                     style={
                         'flex': '1',
@@ -637,7 +725,7 @@ layout = html.Div(
                     }
                 ),
                 html.Div(
-                    dcc.Graph(id='country-bar', figure=fig_country_bar, config={'displayModeBar': False}),
+                    dcc.Graph(id='country-bar', figure={}, config={'displayModeBar': False}),
                     className='chart-card',
                     style={
                         'flex': '1',
@@ -651,7 +739,7 @@ layout = html.Div(
                     }
                 ),
                 html.Div(
-                    dcc.Graph(id='lang-bar', figure=fig_lang_bar, config={'displayModeBar': False}),
+                    dcc.Graph(id='lang-bar', figure={}, config={'displayModeBar': False}),
                     className='chart-card',
                     style={
                         'flex': '1',
@@ -665,7 +753,7 @@ layout = html.Div(
                     }
                 ),
                 html.Div(
-                    dcc.Graph(id='line-chart', figure=fig_line, config={'displayModeBar': False}),
+                    dcc.Graph(id='volume-line', figure={}, config={'displayModeBar': False}),
                     className='chart-card',
                     style={
                         'flex': '1',
@@ -679,7 +767,7 @@ layout = html.Div(
                     }
                 ),
                 html.Div(
-                    dcc.Graph(id='genre-bar', figure=fig_genre_bar, config={'displayModeBar': False}),
+                    dcc.Graph(id='genre-bar', figure={}, config={'displayModeBar': False}),
                     className='chart-card',
                     style={
                         'flex': '1',
@@ -766,79 +854,58 @@ layout = html.Div(
     }
 )
 
-# =========================
-# THEME RESTYLE (no redesign)
-# =========================
-
-def _apply_theme(fig, theme):
-    """Restyle an existing figure to match the theme, without changing data/structure."""
-    if theme == "light":
-        text_color = "#0F0F0F"
-        bg_color = "#FFFFFF"
-        grid_color = "#DDDDDD"
-    else:
-        text_color = "#FFFFFF"
-        bg_color = "rgba(0,0,0,0)"
-        grid_color = "#333333"
-
-    fig.update_layout(
-        paper_bgcolor=bg_color,
-        plot_bgcolor=bg_color,
-        font_color=text_color,
-        title_font=dict(color=text_color),
-        xaxis=dict(
-            showgrid=False,
-            tickfont=dict(color=text_color),
-            gridcolor=grid_color
-        ),
-        yaxis=dict(
-            showgrid=False,
-            tickfont=dict(color=text_color),
-            gridcolor=grid_color
-        ),
-        legend=dict(font=dict(color=text_color))
+
+OVERVIEW_CHARTS = ["type-pie", "year-bar", "category-hist", "country-bar", "lang-bar", "volume-line", "genre-bar"]
+
+
+# All seven charts and the KPI tiles are re-rendered from one cube lookup
+@callback(
+    *[Output(id, "figure") for id in OVERVIEW_CHARTS],
+    Output('kpi-titles', 'children'),
+    Output('kpi-cagr', 'children'),
+    Output('kpi-countries', 'children'),
+    Output('kpi-genres', 'children'),
+    Output('kpi-shannon', 'children'),
+    Output('kpi-titles-spark', 'figure'),
+    Output('kpi-cagr-spark', 'figure'),
+    Output('kpi-countries-spark', 'figure'),
+    Output('kpi-genres-spark', 'figure'),
+    Output('kpi-shannon-spark', 'figure'),
+    Input('exec-type', 'value'),
+    Input('exec-year', 'value'),
+    Input('exec-country', 'value'),
+    State("current-theme", "data")
+)
+def update_overview(type_, year_range, country, theme):
+    ov = overview(type_ or 'all', tuple(year_range) if year_range else None, country or 'all')
+    kpi = kpis(ov)
+    yearly = kpi['yearly']
+    theme = 'light' if theme == 'light' else 'dark'
+    charts = [
+        build(ov, theme)
+        for build in (type_pie_figure, year_bar_figure, category_figure, country_bar_figure,
+                      language_bar_figure, volume_line_figure, genre_bar_figure)
+    ]
+    return (
+        *charts,
+        f"{kpi['titles']}",
+        f"{kpi['cagr']:.2f}%",
+        f"{kpi['countries']}",
+        f"{kpi['genres']}",
+        f"{kpi['shannon']:.2f}",
+        sparkline_figure(yearly, 'Count', '#E50914'),
+        sparkline_figure(yearly, 'Count', '#B20710'),
+        sparkline_figure(yearly, 'country', '#E50914', fill=False),
+        sparkline_figure(yearly, 'Genre Count', '#E50914'),
+        sparkline_figure(yearly, 'Diversity', '#B0262D'),
     )
-    return fig
-
-
-@callback(Output("type-pie", "figure", allow_duplicate=True),
-          Input("current-theme", "data"),
-          prevent_initial_call="initial_duplicate")
-def _theme_pie(theme):
-    return _apply_theme(fig_pie, theme)
-
-@callback(Output("year-bar", "figure", allow_duplicate=True),
-          Input("current-theme", "data"),
-          prevent_initial_call="initial_duplicate")
-def _theme_year_bar(theme):
-    return _apply_theme(fig_bar, theme)
-
-@callback(Output("category-hist", "figure", allow_duplicate=True),
-          Input("current-theme", "data"),
-          prevent_initial_call="initial_duplicate")
-def _theme_hist(theme):
-    return _apply_theme(fig_hist, theme)
-
-@callback(Output("country-bar", "figure", allow_duplicate=True),
-          Input("current-theme", "data"),
-          prevent_initial_call="initial_duplicate")
-def _theme_country(theme):
-    return _apply_theme(fig_country_bar, theme)
-
-@callback(Output("lang-bar", "figure", allow_duplicate=True),
-          Input("current-theme", "data"),
-          prevent_initial_call="initial_duplicate")
-def _theme_lang(theme):
-    return _apply_theme(fig_lang_bar, theme)
-
-@callback(Output("line-chart", "figure", allow_duplicate=True),
-          Input("current-theme", "data"),
-          prevent_initial_call="initial_duplicate")
-def _theme_line(theme):
-    return _apply_theme(fig_line, theme)
-
-@callback(Output("genre-bar", "figure", allow_duplicate=True),
-          Input("current-theme", "data"),
-          prevent_initial_call="initial_duplicate")
-def _theme_genre(theme):
-    return _apply_theme(fig_genre_bar, theme)
+
+
+# A theme switch only recolors the charts already on the page
+@callback(
+    [Output(id, "figure", allow_duplicate=True) for id in OVERVIEW_CHARTS],
+    Input("current-theme", "data"),
+    prevent_initial_call=True
+)
+def restyle_overview(theme):
+    return [theme_patch(theme)] * len(OVERVIEW_CHARTS)
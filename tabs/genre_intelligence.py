@@ -6,8 +6,11 @@ import networkx as nx
 from itertools import combinations
 import dash
 
+from tabs.catalog import read_catalog
+from tabs.theme import template_for
+
 # --- Load & Prepare Data ---
-df = pd.read_csv('./data/netflix_titles.csv')
+df = read_catalog()
 
 df['country'] = df['country'].fillna('Unknown')
 df['listed_in'] = df['listed_in'].fillna('Unknown')
@@ -221,17 +224,16 @@ def update_genre_tab(type_, country, rating, year_range, current_theme):
         paper_color = 'var(--background-color)'
         font_color = '#000000'
         subtext_color = '#555555'
-        grid_color = '#cccccc'
         card_bg = 'var(--card-bg)'
     else:
         bg_color = '#121212'
         paper_color = '#121212'
         font_color = '#ffffff'
         subtext_color = '#cccccc'
-        grid_color = '#333333'
         card_bg = '#1b1b1b'
 
     accent_color = '#E50914'
+    template = template_for(current_theme)
 
     # --- Title + Description ---
     title_style = {
@@ -258,9 +260,9 @@ def update_genre_tab(type_, country, rating, year_range, current_theme):
         title='Top 10 Genres'
     )
     fig_top.update_layout(
-        plot_bgcolor=bg_color, paper_bgcolor=paper_color,
-        font_color=font_color, title_font_color=accent_color,
-        xaxis=dict(showgrid=True, gridcolor=grid_color),
+        template=template, plot_bgcolor=bg_color, paper_bgcolor=paper_color,
+        title_font_color=accent_color,
+        xaxis=dict(showgrid=True),
         yaxis={'categoryorder': 'total ascending'},
         coloraxis_showscale=False
     )
@@ -274,10 +276,10 @@ def update_genre_tab(type_, country, rating, year_range, current_theme):
         title='Genre Popularity Over Time'
     )
     fig_trend.update_layout(
-        plot_bgcolor=bg_color, paper_bgcolor=paper_color,
-        font_color=font_color, title_font_color=accent_color,
-        xaxis=dict(showgrid=True, gridcolor=grid_color),
-        yaxis=dict(showgrid=True, gridcolor=grid_color)
+        template=template, plot_bgcolor=bg_color, paper_bgcolor=paper_color,
+        title_font_color=accent_color,
+        xaxis=dict(showgrid=True),
+        yaxis=dict(showgrid=True)
     )
 
     # --- KPI Cards ---
@@ -325,10 +327,10 @@ def update_genre_tab(type_, country, rating, year_range, current_theme):
     fig_heat.update_layout(
         autosize=True, height=900,
         margin=dict(l=100, r=100, t=100, b=100),
-        plot_bgcolor=bg_color, paper_bgcolor=paper_color,
-        font_color=font_color, title_font_color=accent_color,
-        xaxis=dict(showticklabels=True, tickangle=45, automargin=True),
-        yaxis=dict(showticklabels=True, automargin=True)
+        template=template, plot_bgcolor=bg_color, paper_bgcolor=paper_color,
+        title_font_color=accent_color,
+        xaxis=dict(showticklabels=True, tickangle=45),
+        yaxis=dict(showticklabels=True)
     )
 
     # --- Strategic KPIs ---
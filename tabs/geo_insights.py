@@ -1,14 +1,17 @@
-from dash import Dash, html, dcc, dash_table, Output, Input, callback
+from dash import Dash, html, dcc, dash_table, Output, Input, callback, ctx, no_update
 import pandas as pd
 import plotly.express as px
 import numpy as np
 
+from tabs.catalog import language_counts, load_titles
+from tabs.theme import template_for, theme_patch, themed_specs
+
 
 # =====================================
 # LOAD & PROCESS DATA
 # =====================================
 
-df = pd.read_csv('./data/netflix_titles.csv')
+df = load_titles().copy()
 
 # Type counts
 type_counts = df['type'].value_counts().reset_index()
@@ -32,35 +35,10 @@ num_years = len(year_counts) - 1
 CAGR = ((end_value / start_value) ** (1 / num_years) - 1) * 100
 
 # Language detection
-lang_keywords = {
-    'Hindi': ['Bollywood', 'Indian'],
-    'Japanese': ['Anime', 'Japanese'],
-    'Korean': ['Korean', 'K-drama'],
-    'Spanish': ['Spanish', 'Español', 'Mexico', 'Spanish-language'],
-    'French': ['French', 'Paris'],
-    'English': ['British', 'American', 'English']
-}
-
-language_counts = {}
-for lang, keywords in lang_keywords.items():
-    count = df[df['listed_in'].str.contains('|'.join(keywords), case=False, na=False) |
-               df['description'].str.contains('|'.join(keywords), case=False, na=False)].shape[0]
-    language_counts[lang] = count
-
-lang_df = pd.DataFrame(list(language_counts.items()), columns=['Language', 'Count']).sort_values(by='Count', ascending=False)
+lang_df = language_counts(df['language_mask'].to_numpy())
 
 # Rating category classification
-rating_groups = {
-    'Kids': ['TV-Y', 'TV-Y7', 'TV-G', 'G', 'TV-Y7-FV'],
-    'Teens': ['TV-PG', 'PG', 'PG-13', 'TV-14'],
-    'Adults': ['TV-MA', 'R', 'NC-17', 'NR', 'UR']
-}
-def cat(x):
-    for k, v in rating_groups.items():
-        if x['rating'] in v:
-            return k
-    return 'Unknown'
-df['category'] = df.apply(lambda x: cat(x), axis=1)
+df['category'] = df['category'].cat.add_categories('Unknown').fillna('Unknown')
 
 
 # =====================================
@@ -85,8 +63,6 @@ fig_world.update_layout(
     title={'text': 'Netflix Titles by Each Country', 'x': 0.5, 'xanchor': 'center', 'font': {'size': 22}},
     height=600,
     margin=dict(l=0, r=0, t=40, b=0),
-    paper_bgcolor='rgba(0,0,0,0)',
-    plot_bgcolor='rgba(0,0,0,0)',
     geo=dict(
         showframe=False,
         showcoastlines=True,
@@ -260,6 +236,46 @@ fig_market = px.scatter(
 fig_market.update_traces(textposition='top center', marker=dict(size=10, line=dict(width=1, color='white')))
 
 
+# =====================================
+# THEMED FIGURE SPECS
+# =====================================
+
+THEME_COLORS = {
+    # text, background, grid, ocean
+    'light': ("#0F0F0F", "#FFFFFF", "var(--grid-color-light)", "rgba(240,240,240,0.90)"),
+    'dark': ("#FFFFFF", "#0F0F0F", "var(--grid-color-dark)", "rgba(40,40,40,0.90)"),
+}
+GEO_FIGURES = {
+    "fig_world": fig_world, "fig_country_bar": fig_country_bar, "fig_heatmap": fig_heatmap,
+    "fig_region_bar": fig_region_bar, "fig_region_trend": fig_region_trend,
+    "fig_region_genre": fig_region_genre, "fig_prod_hubs": fig_prod_hubs, "fig_market": fig_market
+}
+MAP_FIGURES = {id for id, fig in GEO_FIGURES.items() if fig.layout.geo.to_plotly_json()}
+
+
+def _theme_layout(theme, has_map=False):
+    """What this tab sets on top of the theme's template."""
+    text_color, bg_color, grid_color, ocean_color = THEME_COLORS['light' if theme == 'light' else 'dark']
+    layout = dict(
+        paper_bgcolor=bg_color,
+        plot_bgcolor=bg_color,
+        xaxis=dict(showgrid=True, gridcolor=grid_color, color=text_color),
+        yaxis=dict(showgrid=True, gridcolor=grid_color, color=text_color)
+    )
+    # Update ocean color for maps
+    if has_map:
+        layout['geo'] = dict(oceancolor=ocean_color)
+    return layout
+
+
+# Both theme variants of every figure, frozen once and shared by all requests
+GEO_SPECS = {
+    id: themed_specs(fig, lambda theme, has_map=id in MAP_FIGURES: dict(
+        _theme_layout(theme, has_map), template=template_for(theme)))
+    for id, fig in GEO_FIGURES.items()
+}
+
+
 # =====================================
 # STYLES AND LAYOUT
 # =====================================
@@ -306,14 +322,14 @@ layout = html.Div(
             }
         ),
 
-        dcc.Graph(id='fig_world', figure=fig_world, config={'displayModeBar': False}, style=card_style()),
-        dcc.Graph(id='fig_country_bar', figure=fig_country_bar, config={'displayModeBar': False}, style=card_style()),
-        dcc.Graph(id='fig_heatmap', figure=fig_heatmap, config={'displayModeBar': False}, style=card_style()),
-        dcc.Graph(id='fig_region_bar', figure=fig_region_bar, config={'displayModeBar': False}, style=card_style()),
-        dcc.Graph(id='fig_region_trend', figure=fig_region_trend, config={'displayModeBar': False}, style=card_style()),
-        dcc.Graph(id='fig_region_genre', figure=fig_region_genre, config={'displayModeBar': False}, style=card_style()),
-        dcc.Graph(id='fig_prod_hubs', figure=fig_prod_hubs, config={'displayModeBar': False}, style=card_style()),
-        dcc.Graph(id='fig_market', figure=fig_market, config={'displayModeBar': False}, style=card_style()),
+        dcc.Graph(id='fig_world', figure=GEO_SPECS['fig_world']['dark'], config={'displayModeBar': False}, style=card_style()),
+        dcc.Graph(id='fig_country_bar', figure=GEO_SPECS['fig_country_bar']['dark'], config={'displayModeBar': False}, style=card_style()),
+        dcc.Graph(id='fig_heatmap', figure=GEO_SPECS['fig_heatmap']['dark'], config={'displayModeBar': False}, style=card_style()),
+        dcc.Graph(id='fig_region_bar', figure=GEO_SPECS['fig_region_bar']['dark'], config={'displayModeBar': False}, style=card_style()),
+        dcc.Graph(id='fig_region_trend', figure=GEO_SPECS['fig_region_trend']['dark'], config={'displayModeBar': False}, style=card_style()),
+        dcc.Graph(id='fig_region_genre', figure=GEO_SPECS['fig_region_genre']['dark'], config={'displayModeBar': False}, style=card_style()),
+        dcc.Graph(id='fig_prod_hubs', figure=GEO_SPECS['fig_prod_hubs']['dark'], config={'displayModeBar': False}, style=card_style()),
+        dcc.Graph(id='fig_market', figure=GEO_SPECS['fig_market']['dark'], config={'displayModeBar': False}, style=card_style()),
     ],
     className='geo-insights',
     style={'backgroundColor': 'var(--background-color)', 'padding': '60px 20px'}
@@ -324,43 +340,13 @@ layout = html.Div(
 # CALLBACKS (Theme-safe: does not touch color sequences)
 # =====================================
 
-def _apply_theme(fig, theme):
-    if theme == "light":
-        text_color = "#0F0F0F"
-        bg_color = "#FFFFFF"
-        grid_color = "var(--grid-color-light)"
-        ocean_color = "rgba(240,240,240,0.90)"
-    else:
-        text_color = "#FFFFFF"
-        bg_color = "#0F0F0F"
-        grid_color = "var(--grid-color-dark)"
-        ocean_color = "rgba(40,40,40,0.90)"
-    
-    # Update ocean color for maps
-    if 'geo' in fig.layout:
-        fig.layout.geo.update(oceancolor=ocean_color)
-
-    fig.update_layout(
-        paper_bgcolor=bg_color,
-        plot_bgcolor=bg_color,
-        font=dict(color=text_color),
-        title_font=dict(color=text_color),
-        legend=dict(font=dict(color=text_color)),
-        xaxis=dict(showgrid=True, gridcolor=grid_color, color=text_color),
-        yaxis=dict(showgrid=True, gridcolor=grid_color, color=text_color)
-    )
-    return fig
-
-
 @callback(
-    [Output(id, "figure") for id in [
-        "fig_world", "fig_country_bar", "fig_heatmap",
-        "fig_region_bar", "fig_region_trend",
-        "fig_region_genre", "fig_prod_hubs", "fig_market"
-    ]],
+    [Output(id, "figure") for id in GEO_FIGURES],
     Input("current-theme", "data")
 )
 def update_all_themes(theme):
-    figs = [fig_world, fig_country_bar, fig_heatmap, fig_region_bar,
-            fig_region_trend, fig_region_genre, fig_prod_hubs, fig_market]
-    return [_apply_theme(f, theme) for f in figs]
+    theme = 'light' if theme == 'light' else 'dark'
+    if ctx.triggered_id is None:
+        # tab just mounted with the dark specs; light users get theirs by reference
+        return [no_update if theme == 'dark' else GEO_SPECS[id][theme] for id in GEO_FIGURES]
+    return [theme_patch(theme, _theme_layout(theme, has_map=id in MAP_FIGURES)) for id in GEO_FIGURES]
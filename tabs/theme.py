@@ -0,0 +1,104 @@
+import json
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from dash import Patch
+from plotly.utils import PlotlyJSONEncoder
+
+# Shared figure styling. Two registered templates carry everything the tabs have in common,
+# and figure specs are built and validated once at import, then served by reference.
+NETFLIX_RED = '#E50914'
+
+# text, background, grid, colorway
+THEME_STYLES = {
+    'dark': ('#FFFFFF', 'rgba(0,0,0,0)', '#333333',
+             [NETFLIX_RED, '#B20710', '#F5F5F1', '#831010', '#FF6F61', '#8C8C8C', '#FFA8A8', '#D81F26', '#564D4D', '#FFD6D6']),
+    'light': ('#0F0F0F', '#FFFFFF', '#DDDDDD',
+              [NETFLIX_RED, '#B20710', '#221F1F', '#831010', '#FF6F61', '#8C8C8C', '#F08080', '#D81F26', '#564D4D', '#4A0404']),
+}
+
+
+def _netflix_template(text_color, bg_color, grid_color, colorway):
+    axis = dict(gridcolor=grid_color, linecolor=grid_color, zerolinecolor=grid_color, automargin=True,
+                tickfont=dict(color=text_color), title=dict(font=dict(color=text_color)))
+    return go.layout.Template(layout=dict(
+        autotypenumbers='strict',
+        colorway=colorway,
+        colorscale=dict(sequential=['#B20710', NETFLIX_RED], diverging=['#B20710', bg_color, NETFLIX_RED]),
+        font=dict(family='Segoe UI, sans-serif', color=text_color),
+        title=dict(font=dict(color=text_color)),
+        paper_bgcolor=bg_color,
+        plot_bgcolor=bg_color,
+        xaxis=axis,
+        yaxis=axis,
+        legend=dict(font=dict(color=text_color), bgcolor='rgba(0,0,0,0)'),
+        coloraxis=dict(colorbar=dict(outlinewidth=0, tickfont=dict(color=text_color))),
+        hoverlabel=dict(font=dict(family='Segoe UI, sans-serif')),
+        geo=dict(bgcolor=bg_color, lakecolor=bg_color, showlakes=True),
+    ))
+
+
+TEMPLATES = {theme: f'netflix_{theme}' for theme in THEME_STYLES}
+for _theme, _style in THEME_STYLES.items():
+    pio.templates[TEMPLATES[_theme]] = _netflix_template(*_style)
+# figures built without an explicit template get the slim dark one instead of plotly's ~7 KB default
+pio.templates.default = TEMPLATES['dark']
+
+
+def template_for(theme):
+    """Registered template name for a theme value from the `current-theme` store."""
+    return TEMPLATES['light' if theme == 'light' else 'dark']
+
+
+class FrozenDict(dict):
+    """A dict that refuses in-place changes, so one spec can be shared by every request and thread."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('figure specs are shared across requests; build a new dict instead of mutating')
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(obj):
+    """Plain JSON data (FrozenDict / tuple / scalars) for a figure, layout or any nested dict."""
+    def _freeze(node):
+        if isinstance(node, dict):
+            return FrozenDict((k, _freeze(v)) for k, v in node.items())
+        if isinstance(node, list):
+            return tuple(_freeze(v) for v in node)
+        return node
+    if hasattr(obj, 'to_plotly_json'):
+        obj = obj.to_plotly_json()
+    return _freeze(json.loads(json.dumps(obj, cls=PlotlyJSONEncoder)))
+
+
+def themed_specs(fig, theme_layout, themes=('dark', 'light')):
+    """Frozen copies of `fig` with `theme_layout(theme)` applied, one per theme; `fig` is left untouched."""
+    return {theme: freeze(go.Figure(fig).update_layout(theme_layout(theme))) for theme in themes}
+
+
+# the template itself, for patching a figure from one theme to the other
+TEMPLATE_SPECS = {theme: freeze(pio.templates[name]) for theme, name in TEMPLATES.items()}
+
+
+def theme_patch(theme, layout=None):
+    """A Patch switching a figure to `theme`'s template, then assigning each leaf of `layout`.
+
+    The template goes across whole; the overrides go leaf by leaf so sibling properties survive.
+    """
+    patch = Patch()
+    patch.layout.template = TEMPLATE_SPECS['light' if theme == 'light' else 'dark']
+
+    def assign(target, node):
+        for key, value in node.items():
+            if isinstance(value, dict):
+                assign(target[key], value)
+            else:
+                target[key] = value
+
+    assign(patch.layout, layout or {})
+    return patch